@@ -4,9 +4,11 @@
 import logging
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_HOMEASSISTANT_STOP
+from homeassistant.core import Event, HomeAssistant
 
-from .const import CONF_SERVICES_HANDLER, DOMAIN
+from .caching import VirginMediaCacheAuth
+from .const import CONF_AUTH_CACHE, CONF_SERVICES_HANDLER, DOMAIN
 from .logger import Logger
 from .service_handler import VirginMediaServiceHandler
 
@@ -14,21 +16,25 @@ from .service_handler import VirginMediaServiceHandler
 
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS = ["media_player", "sensor"]
+PLATFORMS = ("media_player", "sensor")
 
 
 async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
     """Set up a device from a config entry."""
     log_formatter = Logger(unique_id=config_entry.unique_id)
     _LOGGER.debug(
-        log_formatter.format("Setting up config entry: %s"),
+        log_formatter.lazy("Setting up config entry: %s"),
         config_entry.unique_id,
     )
 
     # region #-- prepare the memory storage --#
-    _LOGGER.debug(log_formatter.format("preparing memory storage"))
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN].setdefault(config_entry.entry_id, {})
+    _LOGGER.debug(log_formatter.lazy("preparing memory storage"))
+    entry_data: dict = hass.data.setdefault(DOMAIN, {}).setdefault(
+        config_entry.entry_id, {}
+    )
+    entry_data[CONF_AUTH_CACHE] = VirginMediaCacheAuth(
+        hass=hass, unique_id=config_entry.unique_id
+    )
     # endregion
 
     # region #-- listen for config changes --#
@@ -37,18 +43,27 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
     )
     # endregion
 
+    # region #-- close the pooled API sessions when HASS stops --#
+    async def _async_close_apis(_: Event) -> None:
+        """Close the API sessions shared by the caches."""
+        await VirginMediaCacheAuth.async_close_apis()
+
+    config_entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_close_apis)
+    )
+    # endregion
+
     _LOGGER.debug(
-        log_formatter.format("Setting up entities for: %s"),
+        log_formatter.lazy("Setting up entities for: %s"),
         config_entry.unique_id,
     )
-    setup_platforms: list[str] = list(filter(None, PLATFORMS))
-    await hass.config_entries.async_forward_entry_setups(config_entry, setup_platforms)
+    await hass.config_entries.async_forward_entry_setups(config_entry, PLATFORMS)
 
     # region #-- Service Definition --#
-    _LOGGER.debug(log_formatter.format("registering services"))
+    _LOGGER.debug(log_formatter.lazy("registering services"))
     services = VirginMediaServiceHandler(hass=hass)
     services.register_services()
-    hass.data[DOMAIN][config_entry.entry_id][CONF_SERVICES_HANDLER] = services
+    entry_data[CONF_SERVICES_HANDLER] = services
     # endregion
 
     return True
@@ -57,31 +72,33 @@ async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> b
 async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
     """Cleanup when unloading a config entry."""
     log_formatter = Logger(unique_id=config_entry.unique_id)
-    _LOGGER.debug(log_formatter.format("entered"))
+    _LOGGER.debug(log_formatter.lazy("entered"))
 
-    # region #-- remove services but only if there are no other instances --#
+    # region #-- remove services and API sessions but only if there are no other instances --#
     all_config_entries = hass.config_entries.async_entries(domain=DOMAIN)
-    _LOGGER.debug(log_formatter.format("%i instances"), len(all_config_entries))
+    _LOGGER.debug(log_formatter.lazy("%i instances"), len(all_config_entries))
     if len(all_config_entries) == 1:
-        _LOGGER.debug(log_formatter.format("unregistering services"))
+        _LOGGER.debug(log_formatter.lazy("unregistering services"))
         services: VirginMediaServiceHandler = hass.data[DOMAIN][config_entry.entry_id][
             CONF_SERVICES_HANDLER
         ]
         services.unregister_services()
+        _LOGGER.debug(log_formatter.lazy("closing API sessions"))
+        await VirginMediaCacheAuth.async_close_apis()
     # endregion
 
     # region #-- clean up the platforms --#
-    _LOGGER.debug(log_formatter.format("cleaning up platforms"))
+    _LOGGER.debug(log_formatter.lazy("cleaning up platforms"))
     ret = await hass.config_entries.async_unload_platforms(config_entry, PLATFORMS)
     if ret:
-        _LOGGER.debug(log_formatter.format("removing data from memory"))
+        _LOGGER.debug(log_formatter.lazy("removing data from memory"))
         hass.data[DOMAIN].pop(config_entry.entry_id)
         ret = True
     else:
         ret = False
     # endregion
 
-    _LOGGER.debug(log_formatter.format("exited"))
+    _LOGGER.debug(log_formatter.lazy("exited"))
     return ret
 
 
@@ -2,7 +2,6 @@
 
 # region #-- imports --#
 import asyncio
-import datetime
 import json
 import logging
 import os
@@ -132,7 +131,7 @@ async def main():
                 # region #-- update the cache if we need to --#
                 _LOGGER.debug("Checking if we need to update the cache")
                 last_updated = channels.get("updated") / 1000
-                current_epoch = int(time.mktime(datetime.datetime.now().timetuple()))
+                current_epoch = int(time.time())
                 update_interval = 24
                 update_at = last_updated + (update_interval * 60 * 60)
                 if update_at < current_epoch:
@@ -158,7 +157,7 @@ async def main():
                 listings = await api.async_get_listing(
                     location_id=args.location_id,
                     channel_id=args.channel_id,
-                    start_time=int(time.mktime(datetime.datetime.now().timetuple())),
+                    start_time=int(time.time()),
                     duration_hours=args.duration,
                 )
             _LOGGER.info(json.dumps(listings))
@@ -1,14 +1,30 @@
 """Manage caching."""
 
 # region #-- imports --#
-import glob
+import asyncio
+import fnmatch
 import json
 import logging
 import os
-from typing import Any, List, Optional
+import tempfile
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from contextlib import asynccontextmanager
+from functools import cached_property
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    ClassVar,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 
-import homeassistant.util.dt as dt_util
-from homeassistant.backports.enum import StrEnum
 from homeassistant.core import HomeAssistant
 
 from .const import DEF_AUTH_FILE, DEF_CHANNEL_FILE, DEF_CHANNEL_MAPPINGS_FILE, DOMAIN
@@ -17,25 +33,61 @@ from .logger import Logger
 from .pyvmtvguide.api import API, TVChannelLists
 from .pyvmtvguide.exceptions import VirginMediaTVGuideError
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # endregion
 
 _LOGGER = logging.getLogger(__name__)
 
 
-class VirginMediaCacheType(StrEnum):
-    """Enumeration of the possible cache types."""
+CACHE_TYPE_AUTH: str = "auth"
+CACHE_TYPE_CHANNELS: str = "channels"
+CACHE_TYPE_CHANNEL_MAPPINGS: str = "channel_mappings"
+CACHE_TYPE_LISTINGS: str = "listings"
+
+# parsed cache files shared by every cache object, keyed by path, mtime and size
+_PARSED_CONTENTS_MAX: int = 16
+# proportion of the cache age after which a refresh can be started
+_REFRESH_AHEAD: float = 0.9
+_parsed_contents: "OrderedDict[Tuple[str, int, int], Any]" = OrderedDict()
+_parsed_contents_lock: threading.Lock = threading.Lock()
+
+
+def _json_dumps(obj: Any, pretty: bool = False) -> bytes:
+    """Serialise the given object to JSON, using orjson if it is available.
+
+    :param obj: the object to serialise
+    :param pretty: True to indent the output, False for compact output
+    :return: the JSON as bytes
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else None)
+
+    if pretty:
+        return json.dumps(obj, indent=2).encode()
+
+    return json.dumps(obj, separators=(",", ":")).encode()
+
 
-    AUTH = "auth"
-    CHANNELS = "channels"
-    CHANNEL_MAPPINGS = "channel_mappings"
-    LISTINGS = "listings"
+def _json_loads(data: bytes) -> Any:
+    """Deserialise the given JSON, using orjson if it is available."""
+    if orjson is not None:
+        return orjson.loads(data)
+
+    return json.loads(data)
 
 
 class VirginMediaCache:
     """Representation of a genric cache object."""
 
-    _cache_type: VirginMediaCacheType
+    _cache_type: str
+    _dirs_created: ClassVar[Set[str]] = set()
+    _fetches_running: ClassVar[Dict[str, asyncio.Task]] = {}
     _leaf_path: str
+    _pretty: bool = False
 
     async def async_fetch(self) -> None:
         """Stub for fetching details to cache."""
@@ -49,106 +101,286 @@ class VirginMediaCache:
         """
         self._age: int = age
         self._contents: Any = None
+        self._expires_at: Optional[int] = None
+        self._file_signature: Optional[Tuple[int, int]] = None
         self._hass: HomeAssistant = hass
+        self._last_updated: Optional[int] = None
         self._log_formatter = Logger(unique_id=unique_id)
 
         self.unique_id = unique_id
 
-    def _is_loaded(self) -> bool:
-        """Check if the cache has been loaded."""
-        _LOGGER.debug(
-            self._log_formatter.format("entered, cache_type: %s"),
-            self._cache_type,
-        )
-        ret = self.contents is not None
-        _LOGGER.debug(self._log_formatter.format("exited, %s"), ret)
+    async def _async_fetch_once(
+        self, key: str, fetch: Callable[..., Awaitable[None]], **kwargs
+    ) -> None:
+        """Run the given fetch or wait for the one already running for the key.
+
+        Callers that joined a running fetch load its result from the cache file.
+
+        :param key: identifies the fetch so that concurrent callers can share it
+        :param fetch: coroutine function carrying out the fetch
+        :return: None
+        """
+        task: Optional[asyncio.Task] = VirginMediaCache._fetches_running.get(key)
+        if task is None:
+            task = self._hass.async_create_task(fetch(**kwargs))
+            VirginMediaCache._fetches_running[key] = task
+
+            def _fetch_done(done: asyncio.Task) -> None:
+                if VirginMediaCache._fetches_running.get(key) is done:
+                    VirginMediaCache._fetches_running.pop(key)
+
+            task.add_done_callback(_fetch_done)
+            await asyncio.shield(task)
+        else:
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    self._log_formatter.format("waiting for running fetch: %s"), key
+                )
+            await asyncio.shield(task)
+            await self.async_load()
+
+    def _calculate_expires_at(self) -> int:
+        """Calculate the expiry epoch from the contents of the cache."""
+        ret = self.last_updated
+        ret += self._age * 60 * 60
+
         return ret
 
+    def _set_contents(self, value: Any) -> None:
+        """Set the contents of the cache and reset anything derived from them."""
+        self._contents = value
+        self._expires_at = None
+        self._file_signature = None
+        self._last_updated = None
+
+    async def async_clear(self) -> None:
+        """Clear the cache without blocking the event loop."""
+        await self._hass.async_add_executor_job(self.clear)
+
+    async def async_dump(self) -> None:
+        """Dump the cache to a file without blocking the event loop."""
+        await self._hass.async_add_executor_job(self.dump)
+
+    async def async_is_stale(self) -> bool:
+        """Determine if an update is required without blocking the event loop.
+
+        :return: True if an update is required, False otherwise
+        """
+        if self._contents is None:
+            await self.async_load()
+            if self._contents is None:
+                return True
+        elif self.is_stale:
+            # another cache object may have refreshed the file since it was
+            # loaded, this only re-reads it if the file has changed
+            await self.async_load()
+
+        return self.is_stale
+
+    async def async_load(self) -> Any:
+        """Load the cache into memory without blocking the event loop."""
+        return await self._hass.async_add_executor_job(self.load)
+
+    async def async_set_contents(self, value: Any) -> None:
+        """Set the contents of the cache and dump them without blocking the event loop.
+
+        Nothing is written if the contents haven't changed.
+
+        :param value: the new contents of the cache
+        """
+        if value == self._contents:
+            return
+
+        self._set_contents(value)
+        await self.async_dump()
+
     def clear(self) -> None:
         """Clear the cache in memory and on disk."""
-        _LOGGER.debug(self._log_formatter.format("entered"))
+        debug_enabled: bool = _LOGGER.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            _LOGGER.debug(self._log_formatter.format("entered"))
 
-        self._contents = None
+        self._set_contents(None)
 
+        cache_path: str = self.path
         files: List[str]
-        if "*" not in self.path:
-            files = [self.path]
+        if "*" not in cache_path:
+            files = [cache_path]
         else:
-            files = glob.glob(self.path)
-
+            pattern: str = os.path.basename(cache_path)
+            try:
+                with os.scandir(os.path.dirname(cache_path)) as dir_entries:
+                    files = [
+                        entry.path
+                        for entry in dir_entries
+                        if entry.is_file() and fnmatch.fnmatchcase(entry.name, pattern)
+                    ]
+            except FileNotFoundError:
+                files = []
+
+        # group the files by directory so that each directory is only checked once
+        files_by_dir: Dict[str, List[str]] = defaultdict(list)
         for cache_file in files:
-            if os.path.exists(cache_file):
-                _LOGGER.debug(self._log_formatter.format("removing: %s"), cache_file)
-                os.remove(cache_file)
-                # check if the directory needs removing
-                # doing this each go round just in case the list has multiple different locations
-                dir_path = os.path.dirname(cache_file)
-                num_files_left = len([True for _ in list(os.scandir(dir_path))])
-                if num_files_left == 0:
+            files_by_dir[os.path.dirname(cache_file)].append(cache_file)
+
+        for dir_path, dir_files in files_by_dir.items():
+            for cache_file in dir_files:
+                if debug_enabled:
+                    _LOGGER.debug(
+                        self._log_formatter.format("removing: %s"), cache_file
+                    )
+                try:
+                    os.remove(cache_file)
+                except FileNotFoundError:
+                    pass
+
+            try:
+                with os.scandir(dir_path) as dir_entries:
+                    is_empty = next(dir_entries, None) is None
+            except FileNotFoundError:
+                continue
+            if is_empty:
+                if debug_enabled:
                     _LOGGER.debug(
                         self._log_formatter.format("%s is empty, removing it"),
                         dir_path,
                     )
+                try:
                     os.rmdir(dir_path)
+                except FileNotFoundError:
+                    pass
+                VirginMediaCache._dirs_created.discard(dir_path)
 
-        _LOGGER.debug(self._log_formatter.format("exited"))
+        if debug_enabled:
+            _LOGGER.debug(self._log_formatter.format("exited"))
 
     def dump(self) -> None:
         """Dump the contents of the cache to a file."""
-        _LOGGER.debug(
-            self._log_formatter.format("entered, cache_type: %s"),
-            self._cache_type,
-        )
-
-        os.makedirs(os.path.dirname(self.path), exist_ok=True)
-        with open(self.path, "w", encoding="utf8") as cache_file:
-            json.dump(self._contents, cache_file, indent=2)
+        debug_enabled: bool = _LOGGER.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            _LOGGER.debug(
+                self._log_formatter.format("entered, cache_type: %s"),
+                self._cache_type,
+            )
 
-        _LOGGER.debug(
-            self._log_formatter.format("exited, cache_type: %s"),
-            self._cache_type,
+        cache_path: str = self.path
+        dir_path: str = os.path.dirname(cache_path)
+        if dir_path not in VirginMediaCache._dirs_created:
+            os.makedirs(dir_path, exist_ok=True)
+            VirginMediaCache._dirs_created.add(dir_path)
+        data: bytes = _json_dumps(self._contents, pretty=self._pretty)
+        with _parsed_contents_lock:
+            for parsed_key in [key for key in _parsed_contents if key[0] == cache_path]:
+                del _parsed_contents[parsed_key]
+        # write to a temporary file first so a partial write never replaces the cache,
+        # each dump gets its own so concurrent dumps of the same cache don't collide
+        tmp_fd, tmp_path = tempfile.mkstemp(
+            dir=dir_path, prefix=f".{os.path.basename(cache_path)}.", suffix=".tmp"
         )
+        try:
+            with os.fdopen(tmp_fd, "wb") as cache_file:
+                cache_file.write(data)
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        stat_result = os.stat(cache_path)
+        self._file_signature = (stat_result.st_mtime_ns, stat_result.st_size)
+
+        if debug_enabled:
+            _LOGGER.debug(
+                self._log_formatter.format("exited, cache_type: %s"),
+                self._cache_type,
+            )
 
     def fetch(self) -> None:
         """Stub for fetching details to cache."""
 
     def load(self) -> Any:
         """Load the contents of the cache into memory."""
-        _LOGGER.debug(
-            self._log_formatter.format("entered, cache_type: %s"),
-            self._cache_type,
-        )
+        debug_enabled: bool = _LOGGER.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            _LOGGER.debug(
+                self._log_formatter.format("entered, cache_type: %s"),
+                self._cache_type,
+            )
 
-        if self.path:
-            if os.path.exists(self.path):
+        cache_path: str = self.path
+        if cache_path:
+            if debug_enabled:
                 _LOGGER.debug(
                     self._log_formatter.format("loading cache from %s"),
-                    self.path,
+                    cache_path,
                 )
-                with open(self.path, "r", encoding="utf8") as cache_file:
-                    try:
-                        self._contents = json.load(cache_file)
+            try:
+                cache_fd: int = os.open(cache_path, os.O_RDONLY)
+                try:
+                    stat_result = os.fstat(cache_fd)
+                    file_signature = (stat_result.st_mtime_ns, stat_result.st_size)
+                    if self._contents is None or file_signature != self._file_signature:
+                        parsed_key = (cache_path, *file_signature)
+                        with _parsed_contents_lock:
+                            contents = _parsed_contents.get(parsed_key)
+                            if contents is not None:
+                                _parsed_contents.move_to_end(parsed_key)
+                        if contents is None:
+                            # read the whole file in one go, no need for buffered I/O
+                            contents = _json_loads(
+                                os.read(cache_fd, stat_result.st_size)
+                            )
+                            with _parsed_contents_lock:
+                                _parsed_contents[parsed_key] = contents
+                                if len(_parsed_contents) > _PARSED_CONTENTS_MAX:
+                                    _parsed_contents.popitem(last=False)
+                        elif debug_enabled:
+                            _LOGGER.debug(
+                                self._log_formatter.format("using parsed contents")
+                            )
+                        self._set_contents(contents)
+                        self._file_signature = file_signature
+                    elif debug_enabled:
                         _LOGGER.debug(
-                            self._log_formatter.format("cache loaded (%s)"),
-                            self.path,
-                        )
-                    except json.JSONDecodeError:
-                        _LOGGER.error(
-                            self._log_formatter.format("invalid JSON (%s)"),
-                            self.path,
+                            self._log_formatter.format("cache file unchanged")
                         )
+                finally:
+                    os.close(cache_fd)
+            except FileNotFoundError:
+                if debug_enabled:
+                    _LOGGER.debug(
+                        self._log_formatter.format("cache file does not exist")
+                    )
+            except json.JSONDecodeError:
+                _LOGGER.error(
+                    self._log_formatter.format("invalid JSON (%s)"),
+                    cache_path,
+                )
             else:
-                _LOGGER.debug(self._log_formatter.format("cache file does not exist"))
-        else:
+                if debug_enabled:
+                    _LOGGER.debug(
+                        self._log_formatter.format("cache loaded (%s)"),
+                        cache_path,
+                    )
+        elif debug_enabled:
             _LOGGER.debug(self._log_formatter.format("unable to establish cache file"))
 
-        _LOGGER.debug(
-            self._log_formatter.format("exited, cache_type: %s"),
-            self._cache_type,
-        )
+        if debug_enabled:
+            _LOGGER.debug(
+                self._log_formatter.format("exited, cache_type: %s"),
+                self._cache_type,
+            )
 
         return self.contents
 
+    @cached_property
+    def _flag_file(self) -> VirginTvFlagFile:
+        """Return the flag file used to show that a fetch is running.
+
+        :return: the flag file for this cache
+        """
+        return VirginTvFlagFile(
+            path=self._hass.config.path(DOMAIN, f".{self._cache_type}_caching")
+        )
+
     @property
     def contents(self) -> Any:
         """Return the contents of the cache."""
@@ -156,128 +388,307 @@ class VirginMediaCache:
 
     @property
     def expires_at(self) -> int:
-        """Return the expiry epoch for the cache."""
-        ret = int(self.contents.get("updated", 0) / 1000)
-        ret += self._age * 60 * 60
+        """Return the expiry epoch for the cache.
 
-        return ret
+        Calculated once and reused until the contents change.
+        """
+        if self._expires_at is None:
+            self._expires_at = self._calculate_expires_at()
+
+        return self._expires_at
 
     @property
-    def is_stale(self) -> bool:
-        """Determine if an update of the given cache is required.
+    def is_expired(self) -> bool:
+        """Determine if the cached contents have passed their expiry time.
 
-        :return: True if an update is required, False otherwise
+        :return: True if the contents have expired, False otherwise
         """
-        _LOGGER.debug(
-            self._log_formatter.format("entered, cache_type: %s"),
-            self._cache_type,
-        )
-
-        if not self._is_loaded():
-            self.load()
-
-        if not self._is_loaded():
+        current_epoch: int = int(time.time())
+        expires_at: int = self.expires_at
+        ret: bool = expires_at < current_epoch
+        if _LOGGER.isEnabledFor(logging.DEBUG):
             _LOGGER.debug(
-                self._log_formatter.format("exited, cache_type: %s"),
+                self._log_formatter.format(
+                    "cache_type: %s, last updated at: %d, current: %d, "
+                    "needs updating at: %d, stale: %s"
+                ),
                 self._cache_type,
+                self.last_updated,
+                current_epoch,
+                expires_at,
+                ret,
             )
-            return True
 
-        _LOGGER.debug(
-            self._log_formatter.format("last updated at: %d"), self.last_updated
-        )
+        return ret
 
-        current_epoch: int = int(dt_util.now().timestamp())
-        _LOGGER.debug(self._log_formatter.format("current: %d"), current_epoch)
-        _LOGGER.debug(
-            self._log_formatter.format("needs updating at: %d"), self.expires_at
-        )
+    @property
+    def is_missing(self) -> bool:
+        """Determine if there is nothing cached in memory.
 
-        if self.expires_at < current_epoch:
-            _LOGGER.debug(
-                self._log_formatter.format("cache stale by %d seconds"),
-                current_epoch - self.expires_at,
-            )
+        :return: True if nothing is cached, False otherwise
+        """
+        return self._contents is None
+
+    @property
+    def is_refresh_due(self) -> bool:
+        """Determine if the cache is close enough to expiring to be refreshed.
+
+        :return: True if a refresh should be started, False otherwise
+        """
+        return self.refresh_at <= int(time.time())
+
+    @property
+    def is_stale(self) -> bool:
+        """Determine if an update of the given cache is required.
+
+        :return: True if an update is required, False otherwise
+        """
+        if self.is_missing and self.load() is None:
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    self._log_formatter.format("cache_type: %s, nothing cached"),
+                    self._cache_type,
+                )
             return True
-        else:
-            _LOGGER.debug(self._log_formatter.format("exited --> no update required"))
-            return False
+
+        return self.is_expired
 
     @property
     def last_updated(self) -> int:
-        """Return the last updated epoch for the cache."""
-        ret = int(self._contents.get("updated", 0) / 1000)
+        """Return the last updated epoch for the cache.
 
-        return ret
+        Only depends on the contents so is calculated once per change.
+        """
+        if self._last_updated is None:
+            self._last_updated = self._contents.get("updated", 0) // 1000
 
-    @property
+        return self._last_updated
+
+    @cached_property
     def path(self) -> str:
         """Return the path for the specified cache.
 
+        Only depends on the leaf path so is built on first use.
+
         :return: the path to the cache file
         """
         return self._hass.config.path(DOMAIN, self._leaf_path)
 
+    @property
+    def refresh_at(self) -> int:
+        """Return the epoch after which the cache should be refreshed.
+
+        This is ahead of the expiry so the contents can be refreshed whilst
+        they are still usable.
+        """
+        return self.expires_at - int(self._age * 60 * 60 * (1 - _REFRESH_AHEAD))
+
+
+class _PooledAPI:
+    """A logged in API object shared by the fetches for a user."""
+
+    __slots__ = ("api", "evicted", "lock", "password")
+
+    def __init__(self, api: API, password: str) -> None:
+        """Initialise.
+
+        :param api: the logged in API object
+        :param password: the password the API object logged in with
+        """
+        self.api: API = api
+        self.evicted: bool = False
+        self.lock: asyncio.Lock = asyncio.Lock()
+        self.password: str = password
+
+    async def async_close(self) -> None:
+        """Close the API object once the fetch using it has finished."""
+        async with self.lock:
+            # pylint: disable=unnecessary-dunder-call
+            await self.api.__aexit__(None, None, None)
+
 
 class VirginMediaCacheAuth(VirginMediaCache):
     """Representation of the Authentication cache."""
 
-    _cache_type = VirginMediaCacheType.AUTH
+    _api_lock: ClassVar[Optional[asyncio.Lock]] = None
+    _apis: ClassVar[Dict[str, _PooledAPI]] = {}
+    _cache_type = CACHE_TYPE_AUTH
     _leaf_path = DEF_AUTH_FILE
+    _pretty = True
 
-    @VirginMediaCache.contents.setter
-    def contents(self, value):
-        """Return the contents of the cache."""
-        self._contents = value
-        self.dump()
+    @classmethod
+    def _api_evict(cls, username: str, pooled: _PooledAPI) -> bool:
+        """Remove the given API object from the pool.
+
+        Nothing is removed if the pool has already moved on to another API
+        object for the user.
+
+        :param username: the user the API object belongs to
+        :param pooled: the pooled API object to remove
+        :return: True if it was removed, False otherwise
+        """
+        if cls._apis.get(username) is not pooled:
+            return False
+
+        del cls._apis[username]
+        pooled.evicted = True
+        return True
+
+    async def _async_get_pooled_api(self, username: str, password: str) -> _PooledAPI:
+        """Return the pooled API object for the user, logging in if needed.
+
+        :param username: username for the online service
+        :param password: password for the online service
+        :return: the pooled API object
+        """
+        if VirginMediaCacheAuth._api_lock is None:
+            VirginMediaCacheAuth._api_lock = asyncio.Lock()
+
+        stale: Optional[_PooledAPI] = None
+        async with VirginMediaCacheAuth._api_lock:
+            pooled: Optional[_PooledAPI] = VirginMediaCacheAuth._apis.get(username)
+            if pooled is not None and pooled.password != password:
+                VirginMediaCacheAuth._api_evict(username, pooled)
+                stale, pooled = pooled, None
+            if pooled is None:
+                existing_session = self._contents
+                if existing_session is None:
+                    existing_session = await self.async_load()
+                api = API(
+                    username=username,
+                    password=password,
+                    existing_session=existing_session,
+                )
+                # pylint: disable=unnecessary-dunder-call
+                await api.__aenter__()
+                if api.session_details is None:
+                    try:
+                        await api.async_login()
+                    except Exception:
+                        await api.__aexit__(None, None, None)
+                        raise
+                pooled = _PooledAPI(api=api, password=password)
+                VirginMediaCacheAuth._apis[username] = pooled
+
+        if stale is not None:
+            await stale.async_close()
+
+        return pooled
+
+    @classmethod
+    async def async_close_apis(cls, username: Optional[str] = None) -> None:
+        """Close the pooled API objects.
+
+        Any fetch using one of them is allowed to finish first.
+
+        :param username: only close the API object for this user, all if None
+        :return: None
+        """
+        keys = [key for key in cls._apis if username is None or key == username]
+        for key in keys:
+            pooled: _PooledAPI = cls._apis.pop(key)
+            pooled.evicted = True
+            await pooled.async_close()
+
+    @asynccontextmanager
+    async def async_api(self, username: str, password: str) -> AsyncIterator[API]:
+        """Use the logged in API object for the user.
+
+        The API object is shared by all fetches using the same credentials but
+        only one of them can use it at a time, so a login carried out part way
+        through a request never affects another fetch. If the fetch fails the
+        API object is removed from the pool and closed.
+
+        :param username: username for the online service
+        :param password: password for the online service
+        :return: the API object
+        """
+        pooled: Optional[_PooledAPI] = None
+        while pooled is None:
+            candidate: _PooledAPI = await self._async_get_pooled_api(username, password)
+            await candidate.lock.acquire()
+            if candidate.evicted:  # removed whilst waiting so get the new one
+                candidate.lock.release()
+            else:
+                pooled = candidate
+
+        close: bool = False
+        try:
+            yield pooled.api
+        except Exception:
+            # the session may no longer be valid so don't let it be reused
+            close = VirginMediaCacheAuth._api_evict(username, pooled)
+            raise
+        finally:
+            pooled.lock.release()
+            if close:
+                await pooled.async_close()
 
 
 class VirginMediaCacheChannels(VirginMediaCache):
     """Representation of the channels."""
 
-    _cache_type = VirginMediaCacheType.CHANNELS
+    _cache_type = CACHE_TYPE_CHANNELS
     _leaf_path = DEF_CHANNEL_FILE
 
-    # pylint: disable=arguments-differ
-    async def async_fetch(self, username: str, password: str) -> None:
-        """Fetch the channels from the online service and cache locally."""
-        _LOGGER.debug(
-            self._log_formatter.format("entered, cache_type: %s"),
-            self._cache_type,
-        )
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        unique_id: str,
+        age: Optional[int] = None,
+        auth_cache: Optional[VirginMediaCacheAuth] = None,
+    ) -> None:
+        """Initialise.
 
-        flag_cache = VirginTvFlagFile(
-            path=self._hass.config.path(DOMAIN, ".channels_caching")
+        :param age: how long the cache should be valid for (in hours)
+        :param auth_cache: shared authentication cache to use when fetching
+        :param hass: HomeAssistant object (used for path building)
+        :param unique_id: unique_id of the entity using the cache
+        """
+        super().__init__(age=age, hass=hass, unique_id=unique_id)
+        self._auth_cache: VirginMediaCacheAuth = auth_cache or VirginMediaCacheAuth(
+            hass=hass, unique_id=unique_id
         )
+
+    async def _async_fetch(self, username: str, password: str) -> None:
+        """Fetch the channels from the online service and cache locally."""
+        debug_enabled: bool = _LOGGER.isEnabledFor(logging.DEBUG)
+        flag_cache = self._flag_file
         if flag_cache.is_flagged():
-            _LOGGER.debug(self._log_formatter.format("exiting, already running"))
+            if debug_enabled:
+                _LOGGER.debug(self._log_formatter.format("exiting, already running"))
             return
 
+        if debug_enabled:
+            _LOGGER.debug(
+                self._log_formatter.format("entered, cache_type: %s"),
+                self._cache_type,
+            )
+
         flag_cache.create()
         try:
-            cached_session = VirginMediaCacheAuth(
-                hass=self._hass, unique_id=self.unique_id
-            )
-            async with API(
-                username=username,
-                password=password,
-                existing_session=cached_session.load(),
-            ) as channel_api:
+            cached_session = self._auth_cache
+            async with cached_session.async_api(username, password) as channel_api:
                 channels = await channel_api.async_get_channels()
-            if channel_api.session_details != cached_session.contents:
-                _LOGGER.debug(self._log_formatter.format("API session details changed"))
-                cached_session.contents = channel_api.session_details
+                session_details = channel_api.session_details
+            if session_details != cached_session.contents:
+                if debug_enabled:
+                    _LOGGER.debug(
+                        self._log_formatter.format("API session details changed")
+                    )
+                await cached_session.async_set_contents(session_details)
         except VirginMediaTVGuideError as err:
             _LOGGER.error(
                 "Invalid credentials used when attempting to cache the available channels"
             )
-            _LOGGER.debug(
-                self._log_formatter.format(
-                    "type: %s, message: %s", include_lineno=True
-                ),
-                type(err),
-                err,
-            )
+            if debug_enabled:
+                _LOGGER.debug(
+                    self._log_formatter.format(
+                        "type: %s, message: %s", include_lineno=True
+                    ),
+                    type(err),
+                    err,
+                )
         except Exception as err:  # pylint: disable=broad-except
             _LOGGER.error(
                 self._log_formatter.format(
@@ -287,36 +698,44 @@ class VirginMediaCacheChannels(VirginMediaCache):
                 err,
             )
         else:
-            self._contents = channels
-            self.dump()
+            await self.async_set_contents(channels)
         finally:
             flag_cache.delete()
-            _LOGGER.debug(
-                self._log_formatter.format("exited, cache_type: %s"),
-                self._cache_type,
-            )
+            if debug_enabled:
+                _LOGGER.debug(
+                    self._log_formatter.format("exited, cache_type: %s"),
+                    self._cache_type,
+                )
+
+    # pylint: disable=arguments-differ
+    async def async_fetch(self, username: str, password: str) -> None:
+        """Fetch the channels, sharing a fetch that is already running."""
+        await self._async_fetch_once(
+            self._cache_type, self._async_fetch, username=username, password=password
+        )
 
 
 class VirginMediaCacheChannelMappings(VirginMediaCache):
     """Representation of the channel mappings."""
 
-    _cache_type = VirginMediaCacheType.CHANNEL_MAPPINGS
+    _cache_type = CACHE_TYPE_CHANNEL_MAPPINGS
     _leaf_path = DEF_CHANNEL_MAPPINGS_FILE
 
-    async def async_fetch(self) -> None:
+    async def _async_fetch(self) -> None:
         """Retrieve the channel mappings from the online service."""
-        _LOGGER.debug(
-            self._log_formatter.format("entered, cache_type: %s"),
-            self._cache_type,
-        )
-
-        flag_cache = VirginTvFlagFile(
-            path=self._hass.config.path(DOMAIN, ".channel_mappings_caching")
-        )
+        debug_enabled: bool = _LOGGER.isEnabledFor(logging.DEBUG)
+        flag_cache = self._flag_file
         if flag_cache.is_flagged():
-            _LOGGER.debug(self._log_formatter.format("exiting, already running"))
+            if debug_enabled:
+                _LOGGER.debug(self._log_formatter.format("exiting, already running"))
             return
 
+        if debug_enabled:
+            _LOGGER.debug(
+                self._log_formatter.format("entered, cache_type: %s"),
+                self._cache_type,
+            )
+
         flag_cache.create()
 
         try:
@@ -331,27 +750,25 @@ class VirginMediaCacheChannelMappings(VirginMediaCache):
                 err,
             )
         else:
-            self._contents = tvc.channels
-            self.dump()
+            await self.async_set_contents(tvc.channels)
         finally:
             flag_cache.delete()
 
-        _LOGGER.debug(
-            self._log_formatter.format("exited, cache_type: %s"),
-            self._cache_type,
-        )
+        if debug_enabled:
+            _LOGGER.debug(
+                self._log_formatter.format("exited, cache_type: %s"),
+                self._cache_type,
+            )
 
-    @VirginMediaCache.contents.setter
-    def contents(self, value):
-        """Return the contents of the cache."""
-        self._contents = value
-        self.dump()
+    async def async_fetch(self) -> None:
+        """Retrieve the channel mappings, sharing a fetch that is already running."""
+        await self._async_fetch_once(self._cache_type, self._async_fetch)
 
 
 class VirginMediaCacheListings(VirginMediaCache):
     """Representation of the Listings cache."""
 
-    _cache_type = VirginMediaCacheType.LISTINGS
+    _cache_type = CACHE_TYPE_LISTINGS
 
     def __init__(
         self,
@@ -359,52 +776,76 @@ class VirginMediaCacheListings(VirginMediaCache):
         station_id: str,
         unique_id: str,
         age: Optional[int] = None,
+        auth_cache: Optional[VirginMediaCacheAuth] = None,
     ) -> None:
         """Initialise.
 
         :param age: how long the cache should be valid for (in hours)
+        :param auth_cache: shared authentication cache to use when fetching
         :param hass: HomeAssistant object (used for path building)
         :param station_id: the string representing the station ID
         :param unique_id: unique_id of the entity using the cache
         """
         super().__init__(age=age, hass=hass, unique_id=unique_id)
+        self._auth_cache: VirginMediaCacheAuth = auth_cache or VirginMediaCacheAuth(
+            hass=hass, unique_id=unique_id
+        )
         self._station_id = station_id
         self._leaf_path = f"{self._station_id}.json"
 
-    # pylint: disable=arguments-differ
-    async def async_fetch(self, username: str, password: str) -> None:
-        """Retrieve the listings from the API."""
-        _LOGGER.debug(
-            self._log_formatter.format("entered, cache_type: %s"),
-            self._cache_type,
-        )
-        _LOGGER.debug(self._log_formatter.format("station id: %s"), self._station_id)
+    def _calculate_expires_at(self) -> int:
+        """Calculate when the listings expire."""
+        try:
+            prog_last = self._contents["listings"][-1]["endTime"]
+        except KeyError:
+            prog_last = int(time.time()) * 1000
+
+        return (prog_last // 1000) - 60
 
-        flag_cache = VirginTvFlagFile(
+    @cached_property
+    def _flag_file(self) -> VirginTvFlagFile:
+        """Return the flag file used to show that the listings are being fetched.
+
+        :return: the flag file for this station
+        """
+        return VirginTvFlagFile(
             path=self._hass.config.path(DOMAIN, f".{self._station_id}_caching")
         )
+
+    async def _async_fetch(self, username: str, password: str) -> None:
+        """Retrieve the listings for the station from the online service."""
+        debug_enabled: bool = _LOGGER.isEnabledFor(logging.DEBUG)
+        flag_cache = self._flag_file
         if flag_cache.is_flagged():
-            _LOGGER.debug(self._log_formatter.format("exiting, already running"))
+            if debug_enabled:
+                _LOGGER.debug(self._log_formatter.format("exiting, already running"))
             return
 
+        if debug_enabled:
+            _LOGGER.debug(
+                self._log_formatter.format("entered, cache_type: %s"),
+                self._cache_type,
+            )
+            _LOGGER.debug(
+                self._log_formatter.format("station id: %s"), self._station_id
+            )
+
         flag_cache.create()
         try:
-            cached_session = VirginMediaCacheAuth(
-                hass=self._hass, unique_id=self.unique_id
-            )
-            async with API(
-                username=username,
-                password=password,
-                existing_session=cached_session.load(),
-            ) as listing_api:
+            cached_session = self._auth_cache
+            async with cached_session.async_api(username, password) as listing_api:
                 listings = await listing_api.async_get_listing(
                     channel_id=self._station_id,
-                    start_time=int(dt_util.now().timestamp()),
+                    start_time=int(time.time()),
                     duration_hours=self._age,
                 )
-            if listing_api.session_details != cached_session.contents:
-                _LOGGER.debug(self._log_formatter.format("API session details changed"))
-                cached_session.contents = listing_api.session_details
+                session_details = listing_api.session_details
+            if session_details != cached_session.contents:
+                if debug_enabled:
+                    _LOGGER.debug(
+                        self._log_formatter.format("API session details changed")
+                    )
+                await cached_session.async_set_contents(session_details)
         except Exception as err:  # pylint: disable=broad-except
             _LOGGER.error(
                 self._log_formatter.format(
@@ -414,19 +855,21 @@ class VirginMediaCacheListings(VirginMediaCache):
                 err,
             )
         else:
-            self._contents = listings
-            self.dump()
+            await self.async_set_contents(listings)
         finally:
             flag_cache.delete()
-            _LOGGER.debug(
-                self._log_formatter.format("exited, cache_type: %s"),
-                self._cache_type,
-            )
-
-    @property
-    def expires_at(self) -> int:
-        """Return when the listings expire."""
-        prog_last = self.contents["listings"][-1]
-        prog_last = prog_last.get("endTime", (int(dt_util.now().timestamp()) * 1000))
+            if debug_enabled:
+                _LOGGER.debug(
+                    self._log_formatter.format("exited, cache_type: %s"),
+                    self._cache_type,
+                )
 
-        return (prog_last / 1000) - 60
+    # pylint: disable=arguments-differ
+    async def async_fetch(self, username: str, password: str) -> None:
+        """Retrieve the listings, sharing a fetch that is already running."""
+        await self._async_fetch_once(
+            f"{self._cache_type}_{self._station_id}",
+            self._async_fetch,
+            username=username,
+            password=password,
+        )
@@ -5,15 +5,16 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Optional
+from typing import Any, Dict, FrozenSet, Optional, Tuple
 
+import aiohttp
 import homeassistant.helpers.config_validation as cv
 import voluptuous as vol
 from homeassistant import config_entries, data_entry_flow
-from homeassistant.components.zeroconf import ZeroconfServiceInfo
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.dispatcher import async_dispatcher_send
 
+from .caching import VirginMediaCacheAuth
 from .const import (
     CONF_CACHE_CLEAR,
     CONF_CACHE_CONFIRM,
@@ -67,31 +68,34 @@ from .logger import Logger
 from .pyvmtvguide.api import API as VirginMediaAPI
 from .pyvmtvguide.exceptions import VirginMediaTVGuideError
 
+try:
+    from homeassistant.components.zeroconf import ZeroconfServiceInfo
+except ImportError:
+    ZeroconfServiceInfo = None
+
 # endregion
 
 _LOGGER = logging.getLogger(__name__)
 
+_INSTANCE_DISABLED: str = "<i>(disabled)</i>"
+_INSTANCE_ENABLED: str = "<i>(enabled)</i>"
+
+_CREDS_CLEAR_KEYS: FrozenSet[str] = frozenset(
+    {CONF_CHANNEL_PWD, CONF_CHANNEL_USER, CONF_CREDS_CLEAR}
+)
 
-def _get_tivo_name(discovery_info: ZeroconfServiceInfo) -> str:
+
+def _get_tivo_name(discovery_info: dict) -> str:
     """Determine the friendliest device name to use.
 
-    :param discovery_info: details provided by the discovery service
+    :param discovery_info: normalised details provided by the discovery service
     :return: string containing a friendly name
     """
-    if not ZeroconfServiceInfo:
-        ret: str = (
-            discovery_info.get("name", "").split(".")[0]
-            or discovery_info.get("hostname", "").split(".")[0]
-            or discovery_info.get("host", "")
-        )
-    else:
-        ret: str = (
-            discovery_info.name.split(".")[0]
-            or discovery_info.hostname.split(".")[0]
-            or discovery_info.host
-        )
-
-    return ret
+    return (
+        discovery_info["name"].partition(".")[0]
+        or discovery_info["hostname"].partition(".")[0]
+        or discovery_info["host"]
+    )
 
 
 def _is_existing_configured_tivo(
@@ -103,142 +107,156 @@ def _is_existing_configured_tivo(
     :param address: IP address of device to look for
     :return: the configuration entry if the device is configured, None otherwise
     """
-    configured_tivos = hass.config_entries.async_entries(domain=DOMAIN)
-    for tivo in configured_tivos:
-        if tivo.data.get(CONF_HOST).lower() == address.lower():
-            return tivo
-
-
-def _is_valid_tivo(discovery_info: ZeroconfServiceInfo) -> bool:
+    address = address.lower()
+    return next(
+        (
+            tivo
+            for tivo in hass.config_entries.async_entries(domain=DOMAIN)
+            if (tivo.data.get(CONF_HOST) or "").lower() == address
+        ),
+        None,
+    )
+
+
+def _is_valid_tivo(discovery_info: dict) -> bool:
     """Check if there's enough info to be a valid TiVo device.
 
-    :param discovery_info: info provided by the discovery service
+    :param discovery_info: normalised info provided by the discovery service
     :return: True if valid, False otherwise
     """
-    if not ZeroconfServiceInfo:
-        return (
-            discovery_info.get("host")
-            and discovery_info.get("port")
-            and discovery_info.get("properties", {}).get("TSN")
-        )
-    else:
-        return (
-            discovery_info.host
-            and discovery_info.port
-            and discovery_info.properties.get("TSN")
-        )
+    return bool(
+        discovery_info["tsn"] and discovery_info["host"] and discovery_info["port"]
+    )
 
 
-async def _async_build_schema_with_user_input(
-    step: str, user_input: dict, **kwargs
-) -> vol.Schema:
-    """Build the input and validation schema for the config UI.
+def _normalise_discovery_from_dict(discovery_info: dict) -> dict:
+    """Flatten the discovery details provided as a dictionary.
 
-    :param step: the step we're in for a configuration or installation of the integration
-    :param user_input: the data that should be used as defaults
-    :param kwargs: additional information that might be required
-    :return: the schema including necessary restrictions, defaults, pre-selections etc.
+    :param discovery_info: details provided by the discovery service
+    :return: dictionary of the details used by the flow
     """
-    schema = {}
-
-    if step == STEP_CACHE_CONFIRM:
-        schema = {
-            vol.Required(
-                CONF_CACHE_CONFIRM,
-                default=user_input.get(CONF_CACHE_CONFIRM, DEF_CACHE_CONFIRM),
-            ): vol.In({True: "Yes", False: "No"})
-        }
+    properties: dict = discovery_info.get("properties") or {}
+    return {
+        "host": discovery_info.get("host") or "",
+        "hostname": discovery_info.get("hostname") or "",
+        "name": discovery_info.get("name") or "",
+        "port": discovery_info.get("port"),
+        "swversion": properties.get("swversion", ""),
+        "tsn": properties.get("TSN"),
+    }
 
-    if step == STEP_CACHE_MANAGE:
-        schema = {
-            vol.Required(
-                CONF_CREDS_CLEAR,
-                default=user_input.get(CONF_CREDS_CLEAR, DEF_CREDS_CLEAR),
-            ): cv.boolean,
-            vol.Required(
-                CONF_CACHE_CLEAR,
-                default=user_input.get(CONF_CACHE_CLEAR, DEF_CACHE_CLEAR),
-            ): cv.boolean,
-        }
 
-    if step == STEP_DEVICE_PLATFORM:
-        schema = {
-            vol.Required(
-                CONF_DEVICE_PLATFORM,
-                default=user_input.get(CONF_DEVICE_PLATFORM, DEF_DEVICE_PLATFORM),
-            ): vol.In(KNOWN_PLATFORMS),
-        }
+def _normalise_discovery_from_info(discovery_info: ZeroconfServiceInfo) -> dict:
+    """Flatten the discovery details provided as a ZeroconfServiceInfo object.
 
-    if step == STEP_OPTIONS:
-        schema = {
-            vol.Required(
-                CONF_CHANNEL_FETCH_ENABLE,
-                default=user_input.get(
-                    CONF_CHANNEL_FETCH_ENABLE, DEF_CHANNEL_FETCH_ENABLE
-                ),
-            ): cv.boolean,
-            vol.Required(
-                CONF_CHANNEL_USE_MEDIA_BROWSER,
-                default=user_input.get(
-                    CONF_CHANNEL_USE_MEDIA_BROWSER, DEF_CHANNEL_USE_MEDIA_BROWSER
-                ),
-            ): cv.boolean,
-        }
+    :param discovery_info: details provided by the discovery service
+    :return: dictionary of the details used by the flow
+    """
+    properties: dict = discovery_info.properties
+    return {
+        "host": discovery_info.host or "",
+        "hostname": discovery_info.hostname or "",
+        "name": discovery_info.name or "",
+        "port": discovery_info.port,
+        "swversion": properties.get("swversion", ""),
+        "tsn": properties.get("TSN"),
+    }
+
+
+# region #-- select the discovery helpers for this version of HASS --#
+_USE_ZC_DATACLASS: bool = ZeroconfServiceInfo is not None
+if _USE_ZC_DATACLASS:
+    _normalise_discovery = _normalise_discovery_from_info
+else:
+    _normalise_discovery = _normalise_discovery_from_dict
+# endregion
 
-    if step == STEP_TIMEOUTS:
-        schema = {
-            vol.Required(
-                CONF_SCAN_INTERVAL,
-                default=user_input.get(CONF_SCAN_INTERVAL, DEF_SCAN_INTERVAL),
-            ): cv.positive_int,
-            vol.Required(
-                CONF_IDLE_TIMEOUT,
-                default=user_input.get(CONF_IDLE_TIMEOUT, DEF_IDLE_TIMEOUT),
-            ): cv.positive_float,
-        }
-        if kwargs.get("show_channel_timeouts", False):
-            schema.update(
-                {
-                    vol.Required(
-                        CONF_CHANNEL_INTERVAL,
-                        default=user_input.get(
-                            CONF_CHANNEL_INTERVAL, DEF_CHANNEL_INTERVAL
-                        ),
-                    ): vol.All(
-                        cv.positive_int, vol.Range(min=DEF_CHANNEL_INTERVAL_MIN)
-                    ),
-                }
-            )
 
-    if step == STEP_TIVO:
-        schema = {
-            vol.Required(
-                CONF_HOST,
-            ): cv.string,
-            vol.Required(
-                CONF_PORT, default=user_input.get(CONF_PORT, DEF_PORT)
-            ): cv.port,
-        }
+# region #-- validators --#
+_CHANNEL_INTERVAL_VALIDATOR = vol.All(
+    cv.positive_int, vol.Range(min=DEF_CHANNEL_INTERVAL_MIN)
+)
+_PLATFORMS_VALIDATOR = vol.In(KNOWN_PLATFORMS)
+_REGIONS_VALIDATOR = vol.In(KNOWN_V6_REGIONS)
+_YES_NO_VALIDATOR = vol.In({True: "Yes", False: "No"})
+# endregion
 
-    if step == STEP_V6_REGION:
-        schema = {
-            vol.Required(
-                CONF_CHANNEL_REGION,
-                default=user_input.get(CONF_CHANNEL_REGION, DEF_CHANNEL_REGION),
-            ): vol.In(KNOWN_V6_REGIONS),
-        }
+# region #-- fields for each step: (key, default, validator) --#
+_FIELDS_CACHE_CONFIRM: Tuple[Tuple[str, Any, Any], ...] = (
+    (CONF_CACHE_CONFIRM, DEF_CACHE_CONFIRM, _YES_NO_VALIDATOR),
+)
+_FIELDS_CACHE_MANAGE: Tuple[Tuple[str, Any, Any], ...] = (
+    (CONF_CREDS_CLEAR, DEF_CREDS_CLEAR, cv.boolean),
+    (CONF_CACHE_CLEAR, DEF_CACHE_CLEAR, cv.boolean),
+)
+_FIELDS_DEVICE_PLATFORM: Tuple[Tuple[str, Any, Any], ...] = (
+    (CONF_DEVICE_PLATFORM, DEF_DEVICE_PLATFORM, _PLATFORMS_VALIDATOR),
+)
+_FIELDS_OPTIONS: Tuple[Tuple[str, Any, Any], ...] = (
+    (CONF_CHANNEL_FETCH_ENABLE, DEF_CHANNEL_FETCH_ENABLE, cv.boolean),
+    (CONF_CHANNEL_USE_MEDIA_BROWSER, DEF_CHANNEL_USE_MEDIA_BROWSER, cv.boolean),
+)
+_FIELDS_TIMEOUTS: Tuple[Tuple[str, Any, Any], ...] = (
+    (CONF_SCAN_INTERVAL, DEF_SCAN_INTERVAL, cv.positive_int),
+    (CONF_IDLE_TIMEOUT, DEF_IDLE_TIMEOUT, cv.positive_float),
+)
+_FIELDS_TIMEOUTS_CHANNELS: Tuple[Tuple[str, Any, Any], ...] = _FIELDS_TIMEOUTS + (
+    (
+        CONF_CHANNEL_INTERVAL,
+        DEF_CHANNEL_INTERVAL,
+        _CHANNEL_INTERVAL_VALIDATOR,
+    ),
+)
+_FIELDS_TIVO: Tuple[Tuple[str, Any, Any], ...] = (
+    (CONF_HOST, vol.UNDEFINED, cv.string),
+    (CONF_PORT, DEF_PORT, cv.port),
+)
+_FIELDS_V6_REGION: Tuple[Tuple[str, Any, Any], ...] = (
+    (CONF_CHANNEL_REGION, DEF_CHANNEL_REGION, _REGIONS_VALIDATOR),
+)
+_FIELDS_VIRGIN_CREDS: Tuple[Tuple[str, Any, Any], ...] = (
+    (CONF_CHANNEL_USER, None, cv.string),
+    (CONF_CHANNEL_PWD, None, cv.string),
+)
+
+_STEP_FIELDS: Dict[str, Tuple[Tuple[str, Any, Any], ...]] = {
+    STEP_CACHE_CONFIRM: _FIELDS_CACHE_CONFIRM,
+    STEP_CACHE_MANAGE: _FIELDS_CACHE_MANAGE,
+    STEP_DEVICE_PLATFORM: _FIELDS_DEVICE_PLATFORM,
+    STEP_OPTIONS: _FIELDS_OPTIONS,
+    STEP_TIMEOUTS: _FIELDS_TIMEOUTS,
+    STEP_TIVO: _FIELDS_TIVO,
+    STEP_V6_REGION: _FIELDS_V6_REGION,
+    STEP_VIRGIN_CREDS: _FIELDS_VIRGIN_CREDS,
+}
+# endregion
 
-    if step == STEP_VIRGIN_CREDS:
-        schema = {
-            vol.Required(
-                CONF_CHANNEL_USER, default=user_input.get(CONF_CHANNEL_USER)
-            ): cv.string,
-            vol.Required(
-                CONF_CHANNEL_PWD, default=user_input.get(CONF_CHANNEL_PWD)
-            ): cv.string,
-        }
 
-    return vol.Schema(schema)
+def _build_schema_with_user_input(step: str, user_input: dict, **kwargs) -> vol.Schema:
+    """Build the input and validation schema for the config UI.
+
+    Fields without a default (vol.UNDEFINED) are never pre-filled.
+
+    :param step: the step we're in for a configuration or installation of the integration
+    :param user_input: the data that should be used as defaults
+    :param kwargs: additional information that might be required
+    :return: the schema including necessary restrictions, defaults, pre-selections etc.
+    """
+    fields = (
+        _FIELDS_TIMEOUTS_CHANNELS
+        if step == STEP_TIMEOUTS and kwargs.get("show_channel_timeouts", False)
+        else _STEP_FIELDS[step]
+    )
+    return vol.Schema(
+        {
+            (
+                vol.Required(key)
+                if default is vol.UNDEFINED
+                else vol.Required(key, default=user_input.get(key, default))
+            ): validator
+            for key, default, validator in fields
+        }
+    )
 
 
 class VirginTvHandler(config_entries.ConfigFlow, domain=DOMAIN):
@@ -255,6 +273,7 @@ class VirginTvHandler(config_entries.ConfigFlow, domain=DOMAIN):
 
     def __init__(self) -> None:
         """Initialise."""
+        self._api_session: Optional[aiohttp.ClientSession] = None
         self._data: dict = {}
         self._errors: dict = {}
         self._log_formatter = Logger()
@@ -268,49 +287,67 @@ class VirginTvHandler(config_entries.ConfigFlow, domain=DOMAIN):
         """Get the options flow for this handler."""
         return VirginTvOptionsFlowHandler(config_entry=config_entry)
 
+    @callback
+    def async_remove(self) -> None:
+        """Close the session used to validate the credentials."""
+        if self._api_session is not None:
+            self.hass.async_create_task(self._api_session.close())
+            self._api_session = None
+
     async def _async_task_login(self, user_input) -> None:
         """Login to the Virgin Media online service.
 
         :param user_input: credentials for login
         :return: None
         """
-        _LOGGER.debug(self._log_formatter.format("entered, user_input: %s"), user_input)
-        async with VirginMediaAPI(**user_input) as vm_api:
+        debug_enabled: bool = _LOGGER.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            _LOGGER.debug(
+                self._log_formatter.format("entered, user_input: %s"), user_input
+            )
+        if self._api_session is None:
+            self._api_session = aiohttp.ClientSession(raise_for_status=True)
+        async with VirginMediaAPI(**user_input, session=self._api_session) as vm_api:
             try:
                 await vm_api.async_login()
             except VirginMediaTVGuideError as err:
-                _LOGGER.debug(
-                    self._log_formatter.format(
-                        "type: %s, message: %s", include_lineno=True
-                    ),
-                    type(err),
-                    err,
-                )
+                if debug_enabled:
+                    _LOGGER.debug(
+                        self._log_formatter.format(
+                            "type: %s, message: %s", include_lineno=True
+                        ),
+                        type(err),
+                        err,
+                    )
                 self._errors["base"] = "login_error"
 
         self.hass.async_create_task(
             self.hass.config_entries.flow.async_configure(flow_id=self.flow_id)
         )
-        _LOGGER.debug(self._log_formatter.format("exited"))
+        if debug_enabled:
+            _LOGGER.debug(self._log_formatter.format("exited"))
 
     async def async_step_finish(self) -> data_entry_flow.FlowResult:
         """Create the configuration entry.
 
         Should always be the last step in the flow
         """
-        _LOGGER.debug(self._log_formatter.format("entered"))
+        debug_enabled: bool = _LOGGER.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            _LOGGER.debug(self._log_formatter.format("entered"))
         title = (
             self.context.get(CONF_TITLE_PLACEHOLDERS, {}).get(CONF_FLOW_NAME)
             or DEF_FLOW_NAME
         )
-        _LOGGER.debug(
-            self._log_formatter.format(
-                "creating entry --> title: %s; data: %s; options: %s"
-            ),
-            title,
-            self._data,
-            self._options,
-        )
+        if debug_enabled:
+            _LOGGER.debug(
+                self._log_formatter.format(
+                    "creating entry --> title: %s; data: %s; options: %s"
+                ),
+                title,
+                self._data,
+                self._options,
+            )
         return self.async_create_entry(
             title=title, data=self._data, options=self._options
         )
@@ -321,9 +358,14 @@ class VirginTvHandler(config_entries.ConfigFlow, domain=DOMAIN):
         :param user_input: details entered by the user
         :return: the necessary FlowResult
         """
-        _LOGGER.debug(self._log_formatter.format("entered, user_input: %s"), user_input)
+        debug_enabled: bool = _LOGGER.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            _LOGGER.debug(
+                self._log_formatter.format("entered, user_input: %s"), user_input
+            )
         if not self.task_login:
-            _LOGGER.debug(self._log_formatter.format("creating login task"))
+            if debug_enabled:
+                _LOGGER.debug(self._log_formatter.format("creating login task"))
             details: dict = {
                 "username": self._options.get(CONF_CHANNEL_USER),
                 "password": self._options.get(CONF_CHANNEL_PWD),
@@ -336,14 +378,18 @@ class VirginTvHandler(config_entries.ConfigFlow, domain=DOMAIN):
             )
 
         try:
-            _LOGGER.debug(self._log_formatter.format("running login task"))
+            if debug_enabled:
+                _LOGGER.debug(self._log_formatter.format("running login task"))
             await self.task_login
-            _LOGGER.debug(self._log_formatter.format("returned from login task"))
+            if debug_enabled:
+                _LOGGER.debug(self._log_formatter.format("returned from login task"))
         except Exception as err:  # pylint: disable=broad-except
-            _LOGGER.debug(self._log_formatter.format("exception: %s"), err)
+            if debug_enabled:
+                _LOGGER.debug(self._log_formatter.format("exception: %s"), err)
             return self.async_abort(reason="abort_login")
 
-        _LOGGER.debug(self._log_formatter.format("_errors: %s"), self._errors)
+        if debug_enabled:
+            _LOGGER.debug(self._log_formatter.format("_errors: %s"), self._errors)
         if self._errors:
             return self.async_show_progress_done(next_step_id=STEP_VIRGIN_CREDS)
 
@@ -351,11 +397,12 @@ class VirginTvHandler(config_entries.ConfigFlow, domain=DOMAIN):
 
     async def async_step_options(self, user_input=None) -> data_entry_flow.FlowResult:
         """Display generic options for the integration."""
-        _LOGGER.debug(self._log_formatter.format("user_input: %s"), user_input)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(self._log_formatter.format("user_input: %s"), user_input)
         if user_input is not None:
             self._options.update(user_input)
             # region #-- where to next? --#
-            get_creds = any([v for k, v in user_input.items()])
+            get_creds = any(user_input.values())
             if get_creds:
                 return await self.async_step_virgin_creds()
             else:
@@ -364,16 +411,15 @@ class VirginTvHandler(config_entries.ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id=STEP_OPTIONS,
-            data_schema=await _async_build_schema_with_user_input(
-                STEP_OPTIONS, self._options
-            ),
+            data_schema=_build_schema_with_user_input(STEP_OPTIONS, self._options),
             errors=self._errors,
             last_step=False,
         )
 
     async def async_step_timeouts(self, user_input=None) -> data_entry_flow.FlowResult:
         """Prompt for configurable timeouts."""
-        _LOGGER.debug(self._log_formatter.format("user_input: %s"), user_input)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(self._log_formatter.format("user_input: %s"), user_input)
         if user_input is not None:
             self._options[CONF_CONNECT_TIMEOUT] = DEF_CONNECT_TIMEOUT
             self._options[CONF_COMMAND_TIMEOUT] = DEF_COMMAND_TIMEOUT
@@ -382,7 +428,7 @@ class VirginTvHandler(config_entries.ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id=STEP_TIMEOUTS,
-            data_schema=await _async_build_schema_with_user_input(
+            data_schema=_build_schema_with_user_input(
                 STEP_TIMEOUTS,
                 self._options,
                 show_channel_timeouts=self._options.get(
@@ -397,20 +443,26 @@ class VirginTvHandler(config_entries.ConfigFlow, domain=DOMAIN):
 
         Should only end up here if not configuring from a discovered device
         """
-        _LOGGER.debug(self._log_formatter.format("user_input: %s"), user_input)
+        debug_enabled: bool = _LOGGER.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            _LOGGER.debug(self._log_formatter.format("user_input: %s"), user_input)
         if user_input is not None:
             # region #-- check if the tivo already exists --#
-            _LOGGER.debug(
-                self._log_formatter.format("Checking if TiVo exists by address")
-            )
+            if debug_enabled:
+                _LOGGER.debug(
+                    self._log_formatter.format("Checking if TiVo exists by address")
+                )
             tivo = _is_existing_configured_tivo(
                 hass=self.hass, address=user_input.get(CONF_HOST)
             )
             if tivo:
-                _LOGGER.debug(
-                    self._log_formatter.format("found existing TiVo with address %s"),
-                    user_input.get(CONF_HOST),
-                )
+                if debug_enabled:
+                    _LOGGER.debug(
+                        self._log_formatter.format(
+                            "found existing TiVo with address %s"
+                        ),
+                        user_input.get(CONF_HOST),
+                    )
                 return self.async_abort(reason="already_configured")
             # end region
 
@@ -421,16 +473,15 @@ class VirginTvHandler(config_entries.ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id=STEP_TIVO,
-            data_schema=await _async_build_schema_with_user_input(
-                STEP_TIVO, self._options
-            ),
+            data_schema=_build_schema_with_user_input(STEP_TIVO, self._options),
             errors=self._errors,
             last_step=False,
         )
 
     async def async_step_user(self, user_input=None) -> data_entry_flow.FlowResult:
         """Entry point for the flow."""
-        _LOGGER.debug(self._log_formatter.format("user_input: %s"), user_input)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(self._log_formatter.format("user_input: %s"), user_input)
 
         return await self.async_step_tivo()
 
@@ -438,7 +489,8 @@ class VirginTvHandler(config_entries.ConfigFlow, domain=DOMAIN):
         self, user_input=None
     ) -> data_entry_flow.FlowResult:
         """Get the Virgin Media credentials."""
-        _LOGGER.debug(self._log_formatter.format("user_input: %s"), user_input)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(self._log_formatter.format("user_input: %s"), user_input)
         if user_input is not None:
             self.task_login = None
             self._errors = {}
@@ -447,9 +499,7 @@ class VirginTvHandler(config_entries.ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id=STEP_VIRGIN_CREDS,
-            data_schema=await _async_build_schema_with_user_input(
-                STEP_VIRGIN_CREDS, self._options
-            ),
+            data_schema=_build_schema_with_user_input(STEP_VIRGIN_CREDS, self._options),
             errors=self._errors,
             last_step=False,
         )
@@ -458,63 +508,72 @@ class VirginTvHandler(config_entries.ConfigFlow, domain=DOMAIN):
         self, discovery_info: ZeroconfServiceInfo
     ) -> data_entry_flow.FlowResult:
         """Entry point for an automatically discovered device."""
-        _LOGGER.debug(self._log_formatter.format("discovery_info: %s"), discovery_info)
-
-        if not _is_valid_tivo(discovery_info):
-            self.async_abort(reason="incomplete_tivo")
-
-        if not ZeroconfServiceInfo:
-            host = discovery_info.get("host")
-            port = discovery_info.get("port")
-            serial = discovery_info.get("properties", {}).get("TSN")
-            swversion = discovery_info.get("properties", {}).get("swversion", "")
-            zname = discovery_info.get("name")
-        else:
-            host = discovery_info.host
-            port = discovery_info.port
-            serial = discovery_info.properties.get("TSN")
-            swversion = discovery_info.properties.get("swversion", "")
-            zname = discovery_info.name
+        debug_enabled: bool = _LOGGER.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            _LOGGER.debug(
+                self._log_formatter.format("discovery_info: %s"), discovery_info
+            )
+
+        info: dict = _normalise_discovery(discovery_info)
+        if not _is_valid_tivo(info):
+            return self.async_abort(reason="incomplete_tivo")
+
+        host: str = info["host"]
+        serial: Optional[str] = info["tsn"]
+        swversion: str = info["swversion"]
 
         # region #-- set the unique_id --#
         if serial:
-            _LOGGER.debug(self._log_formatter.format("unique_id: %s"), serial)
+            if debug_enabled:
+                _LOGGER.debug(self._log_formatter.format("unique_id: %s"), serial)
             await self.async_set_unique_id(serial)
-            _LOGGER.debug(self._log_formatter.format("dispatching swversion message"))
+            if debug_enabled:
+                _LOGGER.debug(
+                    self._log_formatter.format("dispatching swversion message")
+                )
             async_dispatcher_send(self.hass, SIGNAL_SWVERSION, swversion)
-            _LOGGER.debug(self._log_formatter.format("aborting if already configured"))
+            if debug_enabled:
+                _LOGGER.debug(
+                    self._log_formatter.format("aborting if already configured")
+                )
             self._abort_if_unique_id_configured()
         # endregion
 
         # region #-- check if the TiVo has already been manually configured --#
-        _LOGGER.debug(self._log_formatter.format("checking if TiVo exists by address"))
-        tivo = _is_existing_configured_tivo(hass=self.hass, address=host)
-        if tivo:
+        if debug_enabled:
             _LOGGER.debug(
-                self._log_formatter.format("found existing TiVo with address %s"),
-                host,
+                self._log_formatter.format("checking if TiVo exists by address")
             )
-            _LOGGER.debug(self._log_formatter.format("updating"))
+        tivo = _is_existing_configured_tivo(hass=self.hass, address=host)
+        if tivo:
+            if debug_enabled:
+                _LOGGER.debug(
+                    self._log_formatter.format("found existing TiVo with address %s"),
+                    host,
+                )
+                _LOGGER.debug(self._log_formatter.format("updating"))
             self.hass.config_entries.async_update_entry(entry=tivo, unique_id=serial)
-            _LOGGER.debug(self._log_formatter.format("dispatching swversion message"))
+            if debug_enabled:
+                _LOGGER.debug(
+                    self._log_formatter.format("dispatching swversion message")
+                )
             async_dispatcher_send(self.hass, SIGNAL_SWVERSION, swversion)
             return self.async_abort(reason="already_configured")
 
-        _LOGGER.debug(self._log_formatter.format("no existing TiVo found"))
+        if debug_enabled:
+            _LOGGER.debug(self._log_formatter.format("no existing TiVo found"))
         # endregion
 
         # region #-- set flow title --#
-        self.context[CONF_TITLE_PLACEHOLDERS] = {
-            CONF_FLOW_NAME: _get_tivo_name(discovery_info)
-        }
+        self.context[CONF_TITLE_PLACEHOLDERS] = {CONF_FLOW_NAME: _get_tivo_name(info)}
         # endregion
 
         # region #-- set the data --#
         self._data = {
             CONF_HOST: host,
-            CONF_PORT: port,
+            CONF_PORT: info["port"],
             CONF_SWVERSION: swversion,
-            CONF_ZNAME: zname,
+            CONF_ZNAME: info["name"],
         }
         # endregion
 
@@ -540,21 +599,21 @@ class VirginTvOptionsFlowHandler(config_entries.OptionsFlow):
         super().__init__()
         self._cache_to_clean: dict = {}
         self._config_entry: config_entries.ConfigEntry = config_entry
-        self._data: dict = dict(config_entry.data)
         self._errors: dict = {}
         self._options: dict = dict(config_entry.options)
-        self._log_formatter = Logger()
-        self._logger_prefix: str = "options "
+        self._log_formatter = Logger(prefix="options ")
 
         self.unique_id: str = self._config_entry.unique_id
 
     def _cache_do_cleanup(self) -> None:
         """Trigger the cache cleanup."""
+        debug_enabled: bool = _LOGGER.isEnabledFor(logging.DEBUG)
         # region #-- check for channel cache cleanup --#
         if self._cache_to_clean.get(CONF_CACHE_CLEAR, DEF_CACHE_CLEAR):
-            _LOGGER.debug(
-                self._log_formatter.format("calling service to clear channel cache")
-            )
+            if debug_enabled:
+                _LOGGER.debug(
+                    self._log_formatter.format("calling service to clear channel cache")
+                )
             asyncio.run_coroutine_threadsafe(
                 coro=self.hass.services.async_call(
                     domain=DOMAIN,
@@ -563,9 +622,12 @@ class VirginTvOptionsFlowHandler(config_entries.OptionsFlow):
                 ),
                 loop=self.hass.loop,
             )
-            _LOGGER.debug(
-                self._log_formatter.format("calling service to clear listings cache")
-            )
+            if debug_enabled:
+                _LOGGER.debug(
+                    self._log_formatter.format(
+                        "calling service to clear listings cache"
+                    )
+                )
             asyncio.run_coroutine_threadsafe(
                 coro=self.hass.services.async_call(
                     domain=DOMAIN,
@@ -578,13 +640,17 @@ class VirginTvOptionsFlowHandler(config_entries.OptionsFlow):
 
         # region #-- check for credential cache cleanup --#
         if self._cache_to_clean.get(CONF_CREDS_CLEAR, DEF_CREDS_CLEAR):
-            _LOGGER.debug(self._log_formatter.format("clearing credentials"))
-            to_clear = (CONF_CHANNEL_PWD, CONF_CHANNEL_USER, CONF_CREDS_CLEAR)
-            for prop in to_clear:
-                self._options.pop(prop, None)
-            _LOGGER.debug(
-                self._log_formatter.format("calling service to clear auth cache")
-            )
+            if debug_enabled:
+                _LOGGER.debug(self._log_formatter.format("clearing credentials"))
+            self._options = {
+                key: value
+                for key, value in self._options.items()
+                if key not in _CREDS_CLEAR_KEYS
+            }
+            if debug_enabled:
+                _LOGGER.debug(
+                    self._log_formatter.format("calling service to clear auth cache")
+                )
             asyncio.run_coroutine_threadsafe(
                 coro=self.hass.services.async_call(
                     domain=DOMAIN,
@@ -602,24 +668,29 @@ class VirginTvOptionsFlowHandler(config_entries.OptionsFlow):
         self, user_input=None
     ) -> data_entry_flow.FlowResult:
         """Prompt for confirmation if other instances are configured."""
-        _LOGGER.debug(self._log_formatter.format("user_input: %s"), user_input)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(self._log_formatter.format("user_input: %s"), user_input)
         if user_input is not None:
             if user_input.get(CONF_CACHE_CONFIRM, DEF_CACHE_CONFIRM):
                 self._cache_do_cleanup()
             return await self.async_step_timeouts()
 
         # region #-- get the names of the currently configured instances --#
-        configured_instances = self.hass.config_entries.async_entries(domain=DOMAIN)
-        configured_instances_text = [
-            f"{idx}. {instance.title} <i>({'disabled' if instance.disabled_by else 'enabled'})</i>"
-            for idx, instance in enumerate(configured_instances)
-            if instance.unique_id != self._config_entry.unique_id
-        ]
+        own_unique_id: str = self._config_entry.unique_id
+        configured_instances_text = (
+            f"{idx}. {instance.title} "
+            f"{_INSTANCE_DISABLED if instance.disabled_by else _INSTANCE_ENABLED}"
+            for idx, instance in enumerate(
+                entry
+                for entry in self.hass.config_entries.async_entries(domain=DOMAIN)
+                if entry.unique_id != own_unique_id
+            )
+        )
         # endregion
 
         return self.async_show_form(
             step_id=STEP_CACHE_CONFIRM,
-            data_schema=await _async_build_schema_with_user_input(
+            data_schema=_build_schema_with_user_input(
                 STEP_CACHE_CONFIRM, self._options
             ),
             description_placeholders={
@@ -636,11 +707,12 @@ class VirginTvOptionsFlowHandler(config_entries.OptionsFlow):
 
         These options aren't stored in the entry but should kick off actions to clean up
         """
-        _LOGGER.debug(self._log_formatter.format("user_input: %s"), user_input)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(self._log_formatter.format("user_input: %s"), user_input)
         if user_input is not None:
             configured_instances = self.hass.config_entries.async_entries(domain=DOMAIN)
             self._cache_to_clean.update(user_input)
-            any_cache_selected = any(dict(user_input).values())
+            any_cache_selected = any(user_input.values())
             if (
                 any_cache_selected and len(configured_instances) > 1
             ):  # need to clean and other configured items
@@ -651,9 +723,7 @@ class VirginTvOptionsFlowHandler(config_entries.OptionsFlow):
 
         return self.async_show_form(
             step_id=STEP_CACHE_MANAGE,
-            data_schema=await _async_build_schema_with_user_input(
-                STEP_CACHE_MANAGE, self._options
-            ),
+            data_schema=_build_schema_with_user_input(STEP_CACHE_MANAGE, self._options),
             errors=self._errors,
             last_step=False,
         )
@@ -666,14 +736,15 @@ class VirginTvOptionsFlowHandler(config_entries.OptionsFlow):
         Should be able to determine this automatically really but don't have any other platforms
         to test with. This step is only available after initial configuration.
         """
-        _LOGGER.debug(self._log_formatter.format("user_input: %s"), user_input)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(self._log_formatter.format("user_input: %s"), user_input)
         if user_input is not None:
             self._options.update(user_input)
             return await self.async_step_options()
 
         return self.async_show_form(
             step_id=STEP_DEVICE_PLATFORM,
-            data_schema=await _async_build_schema_with_user_input(
+            data_schema=_build_schema_with_user_input(
                 STEP_DEVICE_PLATFORM, self._options
             ),
             errors=self._errors,
@@ -682,43 +753,36 @@ class VirginTvOptionsFlowHandler(config_entries.OptionsFlow):
 
     async def async_step_init(self, _=None) -> data_entry_flow.FlowResult:
         """Entry point for the flow."""
-        _LOGGER.debug(self._log_formatter.format("entered"))
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(self._log_formatter.format("entered"))
 
         return await self.async_step_device_platform()
 
     async def async_step_options(self, user_input=None) -> data_entry_flow.FlowResult:
         """Display generic options for the integration."""
-        _LOGGER.debug(self._log_formatter.format("user_input: %s"), user_input)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(self._log_formatter.format("user_input: %s"), user_input)
         if user_input is not None:
             self._options.update(user_input)
             # region #-- where to next? --#
-            get_creds = user_input.get(
-                CONF_CHANNEL_FETCH_ENABLE, DEF_CHANNEL_FETCH_ENABLE
-            )
-            if get_creds:
+            if user_input.get(CONF_CHANNEL_FETCH_ENABLE, DEF_CHANNEL_FETCH_ENABLE):
                 return await self.async_step_virgin_creds()
-            else:
-                # region #-- do we need to cleanup --#
-                if not self._options.get(
-                    CONF_CHANNEL_FETCH_ENABLE, DEF_CHANNEL_FETCH_ENABLE
-                ):
-                    return await self.async_step_cache_manage()
-                else:
-                    return await self.async_step_timeouts()
+
+            # fetching is disabled so check if we need to cleanup
+            return await self.async_step_cache_manage()
             # endregion
 
         return self.async_show_form(
             step_id=STEP_OPTIONS,
-            data_schema=await _async_build_schema_with_user_input(
-                STEP_OPTIONS, self._options
-            ),
+            data_schema=_build_schema_with_user_input(STEP_OPTIONS, self._options),
             errors=self._errors,
             last_step=False,
         )
 
     async def async_step_timeouts(self, user_input=None) -> data_entry_flow.FlowResult:
         """Prompt for configurable timeouts."""
-        _LOGGER.debug(self._log_formatter.format("user_input: %s"), user_input)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(self._log_formatter.format("user_input: %s"), user_input)
         if user_input is not None:
             self._options[CONF_CONNECT_TIMEOUT] = DEF_CONNECT_TIMEOUT
             self._options[CONF_COMMAND_TIMEOUT] = DEF_COMMAND_TIMEOUT
@@ -727,7 +791,7 @@ class VirginTvOptionsFlowHandler(config_entries.OptionsFlow):
 
         return self.async_show_form(
             step_id=STEP_TIMEOUTS,
-            data_schema=await _async_build_schema_with_user_input(
+            data_schema=_build_schema_with_user_input(
                 STEP_TIMEOUTS,
                 self._options,
                 show_channel_timeouts=self._options.get(
@@ -743,17 +807,34 @@ class VirginTvOptionsFlowHandler(config_entries.OptionsFlow):
 
         This should alwats be the last step in the flow.
         """
-        _LOGGER.debug(self._log_formatter.format("entered"))
+        debug_enabled: bool = _LOGGER.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            _LOGGER.debug(self._log_formatter.format("entered"))
         title = (
             self.context.get(CONF_TITLE_PLACEHOLDERS, {}).get(CONF_FLOW_NAME)
             or DEF_FLOW_NAME
         )
-        _LOGGER.debug(
-            self._log_formatter.format("title: %s; options: %s"),
-            self._config_entry.unique_id,
-            title,
-            self._options,
-        )
+        if debug_enabled:
+            _LOGGER.debug(
+                self._log_formatter.format("unique_id: %s; title: %s; options: %s"),
+                self._config_entry.unique_id,
+                title,
+                self._options,
+            )
+
+        # region #-- stop using an API logged in with the old credentials --#
+        old_username: Optional[str] = self._config_entry.options.get(CONF_CHANNEL_USER)
+        if old_username and (
+            old_username != self._options.get(CONF_CHANNEL_USER)
+            or self._config_entry.options.get(CONF_CHANNEL_PWD)
+            != self._options.get(CONF_CHANNEL_PWD)
+        ):
+            if debug_enabled:
+                _LOGGER.debug(
+                    self._log_formatter.format("credentials changed, closing API")
+                )
+            await VirginMediaCacheAuth.async_close_apis(username=old_username)
+        # endregion
 
         return self.async_create_entry(title=title, data=self._options)
 
@@ -762,16 +843,15 @@ class VirginTvOptionsFlowHandler(config_entries.OptionsFlow):
 
         Should only reach here if the device platform selected is V6
         """
-        _LOGGER.debug(self._log_formatter.format("user_input: %s"), user_input)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(self._log_formatter.format("user_input: %s"), user_input)
         if user_input is not None:
             self._options.update(user_input)
             return await self.async_step_timeouts()
 
         return self.async_show_form(
             step_id=STEP_V6_REGION,
-            data_schema=await _async_build_schema_with_user_input(
-                STEP_V6_REGION, self._options
-            ),
+            data_schema=_build_schema_with_user_input(STEP_V6_REGION, self._options),
             errors=self._errors,
             last_step=False,
         )
@@ -780,7 +860,8 @@ class VirginTvOptionsFlowHandler(config_entries.OptionsFlow):
         self, user_input=None
     ) -> data_entry_flow.FlowResult:
         """Prompt for the Virgin Media credentials."""
-        _LOGGER.debug(self._log_formatter.format("user_input: %s"), user_input)
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(self._log_formatter.format("user_input: %s"), user_input)
         if user_input is not None:
             self._options.update(user_input)
             if self._options.get(CONF_DEVICE_PLATFORM) == "v6":
@@ -790,9 +871,7 @@ class VirginTvOptionsFlowHandler(config_entries.OptionsFlow):
 
         return self.async_show_form(
             step_id=STEP_VIRGIN_CREDS,
-            data_schema=await _async_build_schema_with_user_input(
-                STEP_VIRGIN_CREDS, self._options
-            ),
+            data_schema=_build_schema_with_user_input(STEP_VIRGIN_CREDS, self._options),
             errors=self._errors,
             last_step=False,
         )
@@ -1,7 +1,12 @@
 """Constants and defaults."""
 
+import sys
+from types import MappingProxyType
+from typing import Mapping
+
 DOMAIN: str = "virginmedia_tv"
 
+CONF_AUTH_CACHE: str = "auth_cache"
 CONF_CACHE_CLEAR: str = "cache_clear"
 CONF_CACHE_CONFIRM: str = "cache_confirm"
 CONF_CHANNEL_FETCH_ENABLE: str = "channel_enable_fetch"
@@ -48,19 +53,23 @@ DEF_IDLE_TIMEOUT: float = 0
 DEF_PORT: int = 31339
 DEF_SCAN_INTERVAL: int = 5
 
-KNOWN_PLATFORMS = {
-    "360": "TV 360",
-    "v6": "V6",
-}
-KNOWN_V6_REGIONS = {
-    "Eng+Lon": "England inside London",
-    "Eng-Lon": "England outside London",
-    "NI": "Northern Ireland",
-    "Scot": "Scotland",
-    "Wales": "Wales",
-}
+KNOWN_PLATFORMS: Mapping[str, str] = MappingProxyType(
+    {
+        "360": "TV 360",
+        "v6": "V6",
+    }
+)
+KNOWN_V6_REGIONS: Mapping[str, str] = MappingProxyType(
+    {
+        "Eng+Lon": "England inside London",
+        "Eng-Lon": "England outside London",
+        "NI": "Northern Ireland",
+        "Scot": "Scotland",
+        "Wales": "Wales",
+    }
+)
 
-SIGNAL_SWVERSION: str = f"{DOMAIN}_swversion"
+SIGNAL_SWVERSION: str = sys.intern(f"{DOMAIN}_swversion")
 
 STEP_CACHE_CONFIRM: str = "cache_confirm"
 STEP_CACHE_MANAGE: str = "cache_manage"
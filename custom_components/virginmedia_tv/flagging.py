@@ -3,6 +3,7 @@
 # region #-- imports --#
 import logging
 import os
+import time
 from typing import Optional
 
 from .logger import Logger
@@ -11,15 +12,37 @@ from .logger import Logger
 
 _LOGGER = logging.getLogger(__name__)
 
+_FLAG_STATE_TTL: float = 1.0
+
 
 class VirginTvFlagFile:
     """Representation of a flag file."""
 
+    __slots__ = (
+        "_flag_dir",
+        "_flag_path",
+        "_flag_state",
+        "_flag_state_checked",
+        "_log_formatter",
+    )
+
     def __init__(self, path: str):
         """Initialise."""
+        self._flag_dir: str = os.path.dirname(path)
         self._flag_path = path
+        self._flag_state: Optional[bool] = None
+        self._flag_state_checked: float = 0.0
         self._log_formatter = Logger()
 
+    def _set_flag_state(self, state: bool) -> None:
+        """Remember whether the flag file exists.
+
+        :param state: True if the flag file exists, False otherwise
+        :return: None
+        """
+        self._flag_state = state
+        self._flag_state_checked = time.monotonic()
+
     def create(self, contents: Optional[str] = None) -> None:
         """Create the flag file using the path denoted by _flag_path.
 
@@ -27,61 +50,75 @@ class VirginTvFlagFile:
         :return: None
         """
         _LOGGER.debug(
-            self._log_formatter.format("entered, include contents: %s"),
+            self._log_formatter.lazy("entered, include contents: %s"),
             contents is not None,
         )
-
-        if self.is_flagged():
+        _LOGGER.debug(
+            self._log_formatter.lazy("creating flag file: %s"),
+            self._flag_path,
+        )
+        try:
+            flag_file = open(self._flag_path, "x", encoding="utf8")
+        except FileExistsError:
+            self._set_flag_state(True)
             _LOGGER.debug(
-                self._log_formatter.format("flag file already exists (%s)"),
+                self._log_formatter.lazy("flag file already exists (%s)"),
                 self._flag_path,
             )
             return
+        except FileNotFoundError:
+            os.makedirs(name=self._flag_dir, exist_ok=True)
+            flag_file = open(self._flag_path, "x", encoding="utf8")
 
-        _LOGGER.debug(
-            self._log_formatter.format("creating flag file: %s"),
-            self._flag_path,
-        )
-        os.makedirs(name=os.path.dirname(self._flag_path), exist_ok=True)
-        with open(self._flag_path, "x", encoding="utf8") as flag_file:
+        with flag_file:
             if contents is not None:
-                _LOGGER.debug(
-                    self._log_formatter.format("writing contents to flag file")
-                )
+                _LOGGER.debug(self._log_formatter.lazy("writing contents to flag file"))
                 flag_file.write(contents)
+        self._set_flag_state(True)
 
-        _LOGGER.debug(self._log_formatter.format("exited"))
+        _LOGGER.debug(self._log_formatter.lazy("exited"))
 
     def delete(self) -> None:
         """Remove the flag file using the path denoted by _flag_path."""
-        _LOGGER.debug(self._log_formatter.format("entered"))
+        _LOGGER.debug(self._log_formatter.lazy("entered"))
 
         if not self._flag_path:
-            _LOGGER.debug(self._log_formatter.format("_flag_path not defined"))
+            _LOGGER.debug(self._log_formatter.lazy("_flag_path not defined"))
             return
 
         _LOGGER.debug(
-            self._log_formatter.format("deleting flag file: %s"),
+            self._log_formatter.lazy("deleting flag file: %s"),
             self._flag_path,
         )
         try:
             os.remove(self._flag_path)
         except FileNotFoundError:
             _LOGGER.debug(
-                self._log_formatter.format("flag file does not exist (%s)"),
+                self._log_formatter.lazy("flag file does not exist (%s)"),
                 self._flag_path,
             )
         else:
             _LOGGER.debug(
-                self._log_formatter.format("flag file successfully removed (%s)"),
+                self._log_formatter.lazy("flag file successfully removed (%s)"),
                 self._flag_path,
             )
+        self._set_flag_state(False)
 
-        _LOGGER.debug(self._log_formatter.format("exited"))
+        _LOGGER.debug(self._log_formatter.lazy("exited"))
 
     def is_flagged(self) -> bool:
         """Check if the flag file denoted by _flag_path exists.
 
+        The result is remembered for a short time so that repeated checks don't
+        each need a stat call. Changes made through this object are reflected
+        immediately.
+
         :return: True if the flag exists, False otherwise
         """
-        return os.path.exists(self._flag_path)
+        if (
+            self._flag_state is None
+            or time.monotonic() - self._flag_state_checked >= _FLAG_STATE_TTL
+        ):
+            self._set_flag_state(os.path.exists(self._flag_path))
+
+        return self._flag_state
@@ -1,22 +1,92 @@
 """Logging."""
 
 # region #-- imports --#
-import inspect
+import sys
+from types import CodeType
+from typing import Dict, Optional, Tuple
 
 # endregion
 
 
+class _LazyMessage:
+    """Log message that is only built when the log record is rendered."""
+
+    __slots__ = ("_caller_code", "_caller_lineno", "_logger", "_message")
+
+    def __init__(
+        self,
+        logger: "Logger",
+        message: str,
+        caller_code: CodeType,
+        caller_lineno: Optional[int],
+    ) -> None:
+        """Initialise."""
+        self._caller_code: CodeType = caller_code
+        self._caller_lineno: Optional[int] = caller_lineno
+        self._logger: Logger = logger
+        self._message: str = message
+
+    def __str__(self) -> str:
+        """Build the message."""
+        return self._logger._build(  # pylint: disable=protected-access
+            self._message, self._caller_code, self._caller_lineno
+        )
+
+
 class Logger:
     """Provide functions for managing log messages."""
 
+    __slots__ = ("_prefix", "_prefix_cache", "_unique_id_fragment")
+
     def __init__(self, unique_id: str = "", prefix: str = ""):
         """Initialise."""
-        self._unique_id: str = unique_id
         self._prefix: str = prefix
+        self._unique_id_fragment: str = f" ({unique_id})" if unique_id else ""
+        self._prefix_cache: Dict[Tuple[CodeType, str], str] = {}
+
+    def _build(
+        self, message: str, caller_code: CodeType, caller_lineno: Optional[int]
+    ) -> str:
+        """Build the log message for the given caller.
+
+        Messages without a line number only depend on the calling function
+        so they are built once and then served from the cache. The cache is
+        keyed on the code object of the caller, which hashes by identity.
+        """
+        if caller_lineno is not None:
+            return (
+                f"{self._prefix}{caller_code.co_name}{self._unique_id_fragment}"
+                f" --> line: {caller_lineno} --> {message}"
+            )
+
+        key = (caller_code, message)
+        ret = self._prefix_cache.get(key)
+        if ret is None:
+            ret = (
+                f"{self._prefix}{caller_code.co_name}{self._unique_id_fragment}"
+                f" --> {message}"
+            )
+            self._prefix_cache[key] = ret
+
+        return ret
 
     def format(self, message: str, include_lineno: bool = False) -> str:
         """Format a log message in the correct format."""
-        caller: inspect.FrameInfo = inspect.stack()[1]
-        line_no = f" --> line: {caller.lineno}" if include_lineno else ""
-        unique_id = f" ({self._unique_id})" if self._unique_id else ""
-        return f"{self._prefix}{caller.function}{unique_id}{line_no} --> {message}"
+        caller = sys._getframe(1)  # pylint: disable=protected-access
+        return self._build(
+            message, caller.f_code, caller.f_lineno if include_lineno else None
+        )
+
+    def lazy(self, message: str, include_lineno: bool = False) -> _LazyMessage:
+        """Return a log message that is only formatted if it is emitted.
+
+        The caller is captured now but the message is built when the logging
+        system renders the record, so suppressed messages cost next to nothing.
+        """
+        caller = sys._getframe(1)  # pylint: disable=protected-access
+        return _LazyMessage(
+            self,
+            message,
+            caller.f_code,
+            caller.f_lineno if include_lineno else None,
+        )
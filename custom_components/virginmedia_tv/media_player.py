@@ -5,8 +5,24 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import random
+import time
 from abc import ABC
-from typing import Any, Callable, Dict, List, Optional
+from collections import OrderedDict
+from functools import partial
+from operator import itemgetter
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Coroutine,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Set,
+    Tuple,
+)
 
 import voluptuous as vol
 from homeassistant.components.media_player import (
@@ -24,7 +40,7 @@ from homeassistant.components.media_player.const import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import STATE_IDLE, STATE_OFF, STATE_PAUSED, STATE_PLAYING
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import HomeAssistant, ServiceCall, callback
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import DeviceInfo
@@ -46,6 +62,7 @@ from .caching import (
     VirginMediaCacheListings,
 )
 from .const import (
+    CONF_AUTH_CACHE,
     CONF_CHANNEL_FETCH_ENABLE,
     CONF_CHANNEL_INTERVAL,
     CONF_CHANNEL_LISTINGS_CACHE,
@@ -84,17 +101,17 @@ from .pyvmtivo.exceptions import (
 
 # endregion
 
-_CHANNEL_REGION_MAPPING: dict = {
-    "Eng-Lon": ["eng", "excl. london"],
-    "Eng+Lon": ["eng", "london"],
-    "NI": ["ni"],
-    "Scot": ["scot"],
-    "Wales": ["wales"],
+_CACHE_JITTER_MAX: float = 600
+_CHANNEL_REGION_MAPPING: Dict[str, FrozenSet[str]] = {
+    "Eng-Lon": frozenset(("eng", "excl. london")),
+    "Eng+Lon": frozenset(("eng", "london")),
+    "NI": frozenset(("ni",)),
+    "Scot": frozenset(("scot",)),
+    "Wales": frozenset(("wales",)),
 }
 _CHANNEL_SEPARATOR: str = ":"
-_FLAG_TURNING_ON: str = "turning_on"
-_FLAG_TURNING_OFF: str = "turning_off"
 _LOGGER = logging.getLogger(__name__)
+_LISTINGS_CACHES_MAX: int = 8
 _MEDIA_POSITION_UPDATE_INTERVAL: float = 60
 _SERVICE_DEFINITIONS = [
     {
@@ -115,8 +132,134 @@ _SERVICE_DEFINITIONS = [
 ]
 
 
+def _get_station_logo(channel_details: dict) -> str:
+    """Retrieve the large station logo from the channel details.
+
+    :param channel_details: the channel as provided by the online service
+    :return: path to the channel logo
+    """
+    station_schedules: list = channel_details.get("stationSchedules", [])
+    if station_schedules:
+        station: dict = station_schedules[0].get("station", {})
+        image_details: dict
+        for image_details in station.get("images", []):
+            if image_details.get("assetType", "").lower() == "station-logo-large":
+                return image_details.get("url", "")
+
+    return ""
+
+
+def _jittered_interval(hours: float) -> dt_util.dt.timedelta:
+    """Vary the given interval by up to 10% (capped at _CACHE_JITTER_MAX seconds).
+
+    Stops entities that were set up together from refreshing in lockstep.
+
+    :param hours: the interval to vary
+    :return: the interval with the jitter applied
+    """
+    jitter: float = min(_CACHE_JITTER_MAX, hours * 60 * 60 * 0.1)
+    return dt_util.dt.timedelta(hours=hours, seconds=random.uniform(-jitter, jitter))
+
+
+def _process_available_channels(
+    channels: List[Dict[str, Any]],
+    channel_mappings: Optional[List[Dict[str, Any]]],
+    region: str,
+) -> Tuple[List[Dict[str, Any]], Dict[int, Dict[str, Any]], Dict[int, str]]:
+    """Build the available channels for the device and index them by number.
+
+    This only works on the given data (nothing is modified in place) so it is
+    safe to run in the executor.
+
+    :param channels: the channels as provided by the online service
+    :param channel_mappings: the V6 channel mappings, None for non-V6 devices
+    :param region: the channel region configured for the device
+    :return: the available channels, the channels by number and the logos by number
+    """
+    if channel_mappings is None:
+        # assume all other devices can use the list as is from the online service
+        channels_available: List[Dict[str, Any]] = channels
+    else:
+        # v6 devices don't merge resolutions onto the same channel number so use the mappings to build
+        # the available channels
+        channels_available = []
+
+        # region #-- bring the sub channels to the root --#
+        for p360_channel in channels:
+            if p360_channel.get("subChannels", []):
+                channels_available.append(p360_channel)
+                for sub_channel in p360_channel.get("subChannels", []):
+                    channels_available.append(sub_channel)
+            else:
+                channels_available.append(p360_channel)
+        # endregion
+
+        # region #-- process only the V6 channels in the specified region --#
+        target_regions: FrozenSet[str] = _CHANNEL_REGION_MAPPING.get(
+            region, frozenset()
+        )
+        indexes_by_number: Dict[Any, List[int]] = {}
+        for oc_idx, online_channel in enumerate(channels_available):
+            indexes_by_number.setdefault(
+                online_channel.get("channelNumber"), []
+            ).append(oc_idx)
+        for cmap in channel_mappings:
+            regions = cmap.get("region", "").lower().split(",")
+            if not regions[0] or not target_regions.isdisjoint(regions):
+                platform_v6_channel: Optional[Tuple[str, Any]] = next(
+                    iter((cmap.get("tv v6") or {}).items()), None
+                )
+                platform_360_channel: Optional[Tuple[str, Any]] = next(
+                    iter((cmap.get("tv 360") or {}).items()), None
+                )
+                if platform_360_channel is not None and platform_v6_channel is not None:
+                    # region #-- lookup in the channels provided by the online service --#
+                    # interested in the channels with same channel number
+                    for oc_idx in list(
+                        indexes_by_number.get(platform_360_channel[1], [])
+                    ):
+                        online_channel = channels_available[oc_idx]
+                        # check for the resolution and update accordingly
+                        station_schedule: list | dict = online_channel.get(
+                            "stationSchedules", []
+                        )
+                        if station_schedule:
+                            station: dict = station_schedule[0].get("station", {})
+                            online_resolution = "hd" if station.get("isHd") else "sd"
+                            if online_resolution == platform_v6_channel[0]:
+                                # copy so the shared cache contents are left alone
+                                channels_available[oc_idx] = {
+                                    **online_channel,
+                                    "channelNumber": platform_v6_channel[1],
+                                }
+                                # keep the index in step with the new number
+                                indexes_by_number[platform_360_channel[1]].remove(
+                                    oc_idx
+                                )
+                                indexes_by_number.setdefault(
+                                    platform_v6_channel[1], []
+                                ).append(oc_idx)
+                    # endregion
+        # endregion
+
+        # the list is new and mostly in order already so sort it where it is
+        channels_available.sort(key=itemgetter("channelNumber"))
+
+    # region #-- index the channels and logos by number (first one wins) --#
+    channels_by_number: Dict[int, Dict[str, Any]] = {}
+    channel_logos: Dict[int, str] = {}
+    for channel in channels_available:
+        channel_number = channel.get("channelNumber")
+        if channel_number not in channels_by_number:
+            channels_by_number[channel_number] = channel
+            channel_logos[channel_number] = _get_station_logo(channel)
+    # endregion
+
+    return channels_available, channels_by_number, channel_logos
+
+
 async def _async_service_wrapper(
-    entity: "VirginMediaPlayer", service_call: ServiceCall
+    entity: "VirginMediaPlayer", service_call: ServiceCall, func_name: str
 ) -> None:
     """Provide greater control over the call to service functions.
 
@@ -124,23 +267,12 @@ async def _async_service_wrapper(
 
     :param entity: entity instance
     :param service_call: details of the service call
+    :param func_name: the name of the entity function that handles the service
     :return: None
     """
-    # retrieve the details about the called service
-    service_details = [
-        service_details
-        for service_details in _SERVICE_DEFINITIONS
-        if service_details.get("name").lower() == service_call.service.lower()
-    ]
-
-    if service_details:
-        service_details = service_details[0]
-        if "func" in service_details:  # make sure there's a function defined
-            if hasattr(
-                entity, service_details.get("func")
-            ):  # check the function exists
-                func_action = getattr(entity, service_details.get("func"))
-                await func_action(**service_call.data, from_service=True)
+    func_action = getattr(entity, func_name, None)
+    if func_action is not None:  # check the function exists
+        await func_action(**service_call.data, from_service=True)
 
 
 async def async_setup_entry(
@@ -159,7 +291,7 @@ async def async_setup_entry(
         platform.async_register_entity_service(
             name=service_details.get("name", ""),
             schema=service_details.get("schema", None),
-            func=_async_service_wrapper,
+            func=partial(_async_service_wrapper, func_name=service_details["func"]),
         )
     # endregion
 
@@ -177,11 +309,18 @@ class VirginMediaPlayer(MediaPlayerEntity, ABC):
         self._channel_current: Dict[str, Any] = {
             "number": None,
         }
+        self._background_tasks: Set[asyncio.Task] = set()
         self._channels_available: List[Dict[str, Any]] = []
+        self._channels_by_number: Dict[int, Dict[str, Any]] = {}
+        self._defer_state_write: bool = False
+        self._listings_caches: OrderedDict[
+            str, VirginMediaCacheListings
+        ] = OrderedDict()
+        self._channel_logos: Dict[int, str] = {}
+        self._channel_titles: Dict[int, str] = {}
         self._client: Client
         self._config: ConfigEntry = config_entry
         self._extra_state_attributes: Dict[str, Any] = {}
-        self._flags: Dict[str, bool] = {}
         self._hass: HomeAssistant = hass
         self._intervals: Dict[str, Callable] = {}
         self._key_to_action: Dict[str, Callable] = {
@@ -191,12 +330,14 @@ class VirginMediaPlayer(MediaPlayerEntity, ABC):
         }
         self._listeners: Dict[str, Callable] = {}
         self._lock_client: asyncio.Lock = asyncio.Lock()
-        self._lock_removing: asyncio.Lock = asyncio.Lock()
+        self._removing: bool = False
         self._log_formatter = Logger(unique_id=config_entry.unique_id)
         self._media_position: Optional[int] = None
         self._media_position_updated_at: Optional[dt_util.dt.datetime] = None
         self._signals: Dict[str, Callable] = {}
         self._state: Optional[str] = None
+        self._turning_off: bool = False
+        self._turning_on: bool = False
 
         self._client = Client(
             host=self._config.data.get(CONF_HOST),
@@ -213,6 +354,9 @@ class VirginMediaPlayer(MediaPlayerEntity, ABC):
                     age=self._config.options.get(
                         CONF_CHANNEL_INTERVAL, DEF_CHANNEL_INTERVAL
                     ),
+                    auth_cache=hass.data[DOMAIN][self._config.entry_id][
+                        CONF_AUTH_CACHE
+                    ],
                     hass=hass,
                     unique_id=self._config.unique_id,
                 ),
@@ -226,106 +370,13 @@ class VirginMediaPlayer(MediaPlayerEntity, ABC):
             }
 
     # region #-- private methods --#
-    def _cache_process_available_channels(self, channel_cache: dict) -> None:
-        """Ensure the available channels matches the device type and region for the device."""
-        if not channel_cache:
-            return
-
-        if (
-            self._config.options.get(CONF_DEVICE_PLATFORM, DEF_DEVICE_PLATFORM).lower()
-            == "v6"
-        ):
-            _LOGGER.debug(self._log_formatter.format("processing V6 channel mappings"))
-            # v6 devices don't merge resolutions onto the same channel number so use the mappings to build
-            # the available channels
-            self._channels_available = []
-
-            # region #-- bring the sub channels to the root --#
-            for p360_channel in channel_cache.get("channels", []):
-                if p360_channel.get("subChannels", []):
-                    self._channels_available.append(p360_channel)
-                    for sub_channel in p360_channel.get("subChannels", []):
-                        self._channels_available.append(sub_channel)
-                else:
-                    self._channels_available.append(p360_channel)
-            # endregion
-
-            # region #-- process only the V6 channels in the specified region --#
-            region = self._config.options.get(CONF_CHANNEL_REGION, DEF_CHANNEL_REGION)
-            for cmap in self._cache_details.get("channel_mappings").contents.get(
-                "channels", []
-            ):
-                regions = cmap.get("region", "").lower().split(",")
-                if (
-                    len(
-                        set(regions).intersection(
-                            _CHANNEL_REGION_MAPPING.get(region, [])
-                        )
-                    )
-                    > 0
-                    or not regions[0]
-                ):
-                    platform_v6_channel: list = []
-                    platform_360_channel: list = []
-                    if "tv v6" in cmap and cmap["tv v6"]:
-                        platform_v6_channel = list(cmap.get("tv v6", {}).items())[0]
-                    if "tv 360" in cmap and cmap["tv 360"]:
-                        platform_360_channel = list(cmap.get("tv 360", {}).items())[0]
-                    if platform_360_channel and platform_v6_channel:
-                        # region #-- lookup in the channels provided by the online service --#
-                        for oc_idx, online_channel in enumerate(
-                            self._channels_available
-                        ):
-                            # interested in the channels with same channel number
-                            if (
-                                online_channel.get("channelNumber")
-                                == platform_360_channel[1]
-                            ):
-                                # check for the resolution and update accordingly
-                                station_schedule: list | dict = online_channel.get(
-                                    "stationSchedules", []
-                                )
-                                if station_schedule:
-                                    station: dict = station_schedule[0].get(
-                                        "station", {}
-                                    )
-                                    online_resolution = (
-                                        "hd" if station.get("isHd") else "sd"
-                                    )
-                                    if online_resolution == platform_v6_channel[0]:
-                                        self._channels_available[oc_idx][
-                                            "channelNumber"
-                                        ] = platform_v6_channel[1]
-                        # endregion
-            # endregion
-
-            self._channels_available = sorted(
-                self._channels_available, key=lambda itm: itm["channelNumber"]
-            )
-            _LOGGER.debug(
-                self._log_formatter.format("finished processing V6 channel mappings")
-            )
-        else:
-            # assume all other devices can use the list as is from the online service
-            _LOGGER.debug(self._log_formatter.format("loading tv 360 channnels"))
-            self._channels_available = channel_cache.get("channels", [])
-
     def _channel_details(self, channel_number: int) -> dict:
         """Retrieve the details for the given channel.
 
         :param channel_number: the channel number to lookup details for
         :return: object containing the details
         """
-        ret = {}
-        channel_details = [
-            channel
-            for channel in self._channels_available
-            if channel.get("channelNumber") == channel_number
-        ]
-        if channel_details:
-            ret = channel_details[0]
-
-        return ret
+        return self._channels_by_number.get(channel_number, {})
 
     def _channel_logo(self, channel_number: int) -> str:
         """Retrieve the logo for the given channel number.
@@ -333,25 +384,7 @@ class VirginMediaPlayer(MediaPlayerEntity, ABC):
         :param channel_number: the channel number to get the logo for
         :return: path to the channel logo
         """
-        ret = ""
-        if self._channels_available:
-            channel_details = self._channel_details(channel_number=channel_number)
-            if channel_details:
-                station_schedules: list = channel_details.get("stationSchedules", [])
-                if station_schedules:
-                    station: dict = station_schedules[0].get("station", {})
-                    station_images: list = station.get("images", [])
-                    image_details: dict
-                    image: list = [
-                        image_details.get("url", "")
-                        for image_details in station_images
-                        if image_details.get("assetType", "").lower()
-                        == "station-logo-large"
-                    ]
-                    if image:
-                        ret = image[0]
-
-        return ret
+        return self._channel_logos.get(channel_number, "")
 
     def _channel_title(self, channel_number: int) -> str:
         """Build the channel title for the given channel.
@@ -359,29 +392,52 @@ class VirginMediaPlayer(MediaPlayerEntity, ABC):
         :param channel_number: channel number to get the title for
         :return: the channel title
         """
-        ret: int | str = channel_number
         channel_name: str = ""
 
         if channel_number == self._channel_current.get("number"):
             channel_name = self._channel_current.get("details", {}).get("title")
         else:
+            # titles for other channels only change when the channels are processed
+            ret: Optional[str] = self._channel_titles.get(channel_number)
+            if ret is not None:
+                return ret
+
             if self._channels_available:
                 channel_name = self._channel_details(channel_number=channel_number).get(
                     "title"
                 )
+            ret = (
+                f"{channel_number}{_CHANNEL_SEPARATOR} {channel_name}"
+                if channel_name
+                else str(channel_number)
+            )
+            self._channel_titles[channel_number] = ret
+            return ret
 
         if channel_name:
-            ret = f"{ret}{_CHANNEL_SEPARATOR} {channel_name}"
+            return f"{channel_number}{_CHANNEL_SEPARATOR} {channel_name}"
 
-        return str(ret)
+        return str(channel_number)
+
+    @callback
+    def _create_background_task(self, coro: Coroutine[Any, Any, None]) -> None:
+        """Run the given coroutine as a task that is cancelled if the entity is removed.
+
+        :param coro: the coroutine to run
+        :return: None
+        """
+        task: asyncio.Task = self._hass.async_create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
 
+    @callback
     def _current_program_get_position(
         self, _: Optional[dt_util.dt.datetime] = None
     ) -> None:
         """Get the current position in the playing media."""
         current_program = self._channel_current.get("program")
         if current_program:
-            self._media_position = int(dt_util.now().timestamp()) - (
+            self._media_position = int(time.time()) - (
                 current_program.get("startTime") / 1000
             )
             self._media_position_updated_at = dt_util.utcnow()
@@ -398,38 +454,44 @@ class VirginMediaPlayer(MediaPlayerEntity, ABC):
             if "media_position" in self._intervals:
                 self._ils_cancel(name="media_position", cancel_type="interval")
 
-        self.async_schedule_update_ha_state()
+        self._write_state()
 
+    @callback
     def _current_program_set(self, _: Optional[dt_util.dt.datetime] = None) -> None:
         """Set the current program from the cached listings."""
-        _LOGGER.debug(self._log_formatter.format("entered"))
-        current_epoch: int = int(dt_util.now().timestamp())
-        current_program: List = []
+        debug_enabled: bool = _LOGGER.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            _LOGGER.debug(self._log_formatter.format("entered"))
+        # listings use epoch milliseconds so compare in those
+        current_epoch_ms: int = int(time.time()) * 1000
+        current_program: Optional[Dict[str, Any]] = None
 
         if self._cache_details.get("listings").contents:
-            current_program = [
-                program
-                for program in self._cache_details.get("listings").contents.get(
-                    "listings", []
-                )
-                if (program.get("endTime") / 1000)
-                >= current_epoch
-                >= (program.get("startTime") / 1000)
-            ]
+            current_program = next(
+                (
+                    program
+                    for program in self._cache_details.get("listings").contents.get(
+                        "listings", []
+                    )
+                    if program["startTime"] <= current_epoch_ms <= program["endTime"]
+                ),
+                None,
+            )
 
-        if current_program:
+        if current_program is not None:
             if "current_program" in self._listeners:  # cancel current program listener
                 self._ils_cancel(name="current_program", cancel_type="listener")
 
-            self._channel_current["program"] = current_program[0]
+            self._channel_current["program"] = current_program
             # region #-- set the program to update after this one finishes --#
             program_change_at = dt_util.dt.datetime.fromtimestamp(
                 (self._channel_current["program"].get("endTime") / 1000) + 1
             )
-            _LOGGER.debug(
-                self._log_formatter.format("setting to change program at: %s"),
-                program_change_at,
-            )
+            if debug_enabled:
+                _LOGGER.debug(
+                    self._log_formatter.format("setting to change program at: %s"),
+                    program_change_at,
+                )
             self._ils_create(
                 create_type="listener",
                 name="current_program",
@@ -440,18 +502,43 @@ class VirginMediaPlayer(MediaPlayerEntity, ABC):
         else:
             self._channel_current["program"] = None
 
-        _LOGGER.debug(
-            self._log_formatter.format("current program is set: %s"),
-            self._channel_current["program"] is not None,
-        )
+        if debug_enabled:
+            _LOGGER.debug(
+                self._log_formatter.format("current program is set: %s"),
+                self._channel_current["program"] is not None,
+            )
 
         self._current_program_get_position()
-        self.async_schedule_update_ha_state()
-        _LOGGER.debug(self._log_formatter.format("exited"))
+        if debug_enabled:
+            _LOGGER.debug(self._log_formatter.format("exited"))
+
+    @callback
+    def _idle_to_off(self, _: Optional[dt_util.dt.datetime] = None) -> None:
+        """Switch the player to off if idle after a period of time."""
+        debug_enabled: bool = _LOGGER.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            _LOGGER.debug(self._log_formatter.format("entered"))
+            _LOGGER.debug(
+                self._log_formatter.format("current state: %s"),
+                self._state,
+            )
+        if self._state == STATE_IDLE:
+            if debug_enabled:
+                _LOGGER.debug(self._log_formatter.format("setting state to off"))
+            self._state = STATE_OFF
+            self.async_write_ha_state()
+        if "idle_to_off" in self._listeners:
+            self._ils_cancel(cancel_type="listener", name="idle_to_off")
+        if debug_enabled:
+            _LOGGER.debug(self._log_formatter.format("exited"))
 
     def _ils_cancel(self, name: str, cancel_type: str) -> None:
         """Cancel the given interval/listener/signal."""
-        _LOGGER.debug(self._log_formatter.format("entered, %s: %s"), cancel_type, name)
+        debug_enabled: bool = _LOGGER.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            _LOGGER.debug(
+                self._log_formatter.format("entered, %s: %s"), cancel_type, name
+            )
 
         if cancel_type not in ("interval", "listener", "signal"):
             raise TypeError(f"Invalid type ({cancel_type})")
@@ -465,15 +552,17 @@ class VirginMediaPlayer(MediaPlayerEntity, ABC):
             unsubs = self._signals
 
         if name in unsubs:
-            _LOGGER.debug(
-                self._log_formatter.format("cancelling %s: %s"),
-                cancel_type,
-                name,
-            )
+            if debug_enabled:
+                _LOGGER.debug(
+                    self._log_formatter.format("cancelling %s: %s"),
+                    cancel_type,
+                    name,
+                )
             unsubs[name]()
             unsubs.pop(name, None)
 
-        _LOGGER.debug(self._log_formatter.format("exited"))
+        if debug_enabled:
+            _LOGGER.debug(self._log_formatter.format("exited"))
 
     def _ils_create(
         self,
@@ -487,17 +576,19 @@ class VirginMediaPlayer(MediaPlayerEntity, ABC):
         `when` is required if creating an interval or listener
         `name` should be the signal to listen for if listening for a signal
         """
-        _LOGGER.debug(
-            self._log_formatter.format("entered, type: %s, name: %s, when: %s"),
-            create_type,
-            name,
-            when,
-        )
+        debug_enabled: bool = _LOGGER.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            _LOGGER.debug(
+                self._log_formatter.format("entered, type: %s, name: %s, when: %s"),
+                create_type,
+                name,
+                when,
+            )
 
         if create_type not in ("interval", "listener", "signal"):
             raise TypeError(f"Invalid type ({create_type})")
 
-        if not self._lock_removing.locked():
+        if not self._removing:
             if create_type == "interval":
                 self._intervals[name] = async_track_time_interval(
                     hass=self._hass, action=func, interval=when
@@ -513,12 +604,52 @@ class VirginMediaPlayer(MediaPlayerEntity, ABC):
                     target=func,
                 )
         else:
-            _LOGGER.debug(
-                self._log_formatter.format("locked not creating the %s"),
-                create_type,
+            if debug_enabled:
+                _LOGGER.debug(
+                    self._log_formatter.format("locked not creating the %s"),
+                    create_type,
+                )
+
+        if debug_enabled:
+            _LOGGER.debug(self._log_formatter.format("exited"))
+
+    def _listings_cache(self, station_id: str) -> VirginMediaCacheListings:
+        """Get the listings cache for the given station.
+
+        The most recently used caches are kept so that returning to a channel
+        doesn't need a new cache object or a reload from disk.
+
+        :param station_id: the station to get the listings cache for
+        :return: the listings cache for the station
+        """
+        cache: Optional[VirginMediaCacheListings] = self._listings_caches.get(
+            station_id
+        )
+        if cache is None:
+            cache = VirginMediaCacheListings(
+                age=self._config.options.get(
+                    CONF_CHANNEL_LISTINGS_CACHE, DEF_CHANNEL_LISTINGS_CACHE
+                ),
+                auth_cache=self._hass.data[DOMAIN][self._config.entry_id][
+                    CONF_AUTH_CACHE
+                ],
+                hass=self._hass,
+                station_id=station_id,
+                unique_id=self._config.unique_id,
             )
+            self._listings_caches[station_id] = cache
+            if len(self._listings_caches) > _LISTINGS_CACHES_MAX:
+                self._listings_caches.popitem(last=False)
+        else:
+            self._listings_caches.move_to_end(station_id)
 
-        _LOGGER.debug(self._log_formatter.format("exited"))
+        return cache
+
+    @callback
+    def _write_state(self) -> None:
+        """Write the state unless it is going to be written anyway."""
+        if not self._defer_state_write:
+            self.async_write_ha_state()
 
     async def _async_cache_channel_mappings(
         self, _: Optional[dt_util.dt.datetime] = None
@@ -527,14 +658,17 @@ class VirginMediaPlayer(MediaPlayerEntity, ABC):
 
         :return: None
         """
-        _LOGGER.debug(self._log_formatter.format("entered"))
+        debug_enabled: bool = _LOGGER.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            _LOGGER.debug(self._log_formatter.format("entered"))
 
         await self._cache_details.get("channel_mappings").async_fetch()
-        self._cache_process_available_channels(
+        await self._async_cache_process_available_channels(
             channel_cache=self._cache_details.get("channels").contents
         )
 
-        _LOGGER.debug(self._log_formatter.format("exited"))
+        if debug_enabled:
+            _LOGGER.debug(self._log_formatter.format("exited"))
 
     async def _async_cache_channels(
         self, _: Optional[dt_util.dt.datetime] = None
@@ -543,14 +677,17 @@ class VirginMediaPlayer(MediaPlayerEntity, ABC):
 
         :return: None
         """
-        _LOGGER.debug(self._log_formatter.format("entered"))
+        debug_enabled: bool = _LOGGER.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            _LOGGER.debug(self._log_formatter.format("entered"))
 
         await self._cache_details.get("channels").async_fetch(
             username=self._config.options.get(CONF_CHANNEL_USER, ""),
             password=self._config.options.get(CONF_CHANNEL_PWD, ""),
         )
 
-        _LOGGER.debug(self._log_formatter.format("exited"))
+        if debug_enabled:
+            _LOGGER.debug(self._log_formatter.format("exited"))
 
     async def _async_cache_listings(
         self, _: Optional[dt_util.dt.datetime] = None
@@ -559,19 +696,17 @@ class VirginMediaPlayer(MediaPlayerEntity, ABC):
 
         :return: None
         """
-        _LOGGER.debug(self._log_formatter.format("entered"))
+        debug_enabled: bool = _LOGGER.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            _LOGGER.debug(self._log_formatter.format("entered"))
 
         if not self._channel_current.get("station_id"):
-            _LOGGER.debug(self._log_formatter.format("exited, no station_id set"))
+            if debug_enabled:
+                _LOGGER.debug(self._log_formatter.format("exited, no station_id set"))
             return
 
-        self._cache_details["listings"] = VirginMediaCacheListings(
-            age=self._config.options.get(
-                CONF_CHANNEL_LISTINGS_CACHE, DEF_CHANNEL_LISTINGS_CACHE
-            ),
-            hass=self._hass,
-            station_id=self._channel_current["station_id"],
-            unique_id=self._config.unique_id,
+        self._cache_details["listings"] = self._listings_cache(
+            station_id=self._channel_current["station_id"]
         )
 
         await self._cache_details["listings"].async_fetch(
@@ -579,7 +714,78 @@ class VirginMediaPlayer(MediaPlayerEntity, ABC):
             password=self._config.options.get(CONF_CHANNEL_PWD, ""),
         )
 
-        _LOGGER.debug(self._log_formatter.format("exited"))
+        if debug_enabled:
+            _LOGGER.debug(self._log_formatter.format("exited"))
+
+    async def _async_cache_process_available_channels(
+        self, channel_cache: dict
+    ) -> None:
+        """Ensure the available channels matches the device type and region for the device.
+
+        The processing is done in the executor so that large channel lists don't
+        hold up the event loop.
+        """
+        debug_enabled: bool = _LOGGER.isEnabledFor(logging.DEBUG)
+        if not channel_cache:
+            return
+
+        channel_mappings: Optional[List[Dict[str, Any]]] = None
+        if (
+            self._config.options.get(CONF_DEVICE_PLATFORM, DEF_DEVICE_PLATFORM).lower()
+            == "v6"
+        ):
+            if debug_enabled:
+                _LOGGER.debug(
+                    self._log_formatter.format("processing V6 channel mappings")
+                )
+            channel_mappings = (
+                self._cache_details.get("channel_mappings").contents or {}
+            ).get("channels", [])
+        else:
+            if debug_enabled:
+                _LOGGER.debug(self._log_formatter.format("loading tv 360 channnels"))
+
+        (
+            self._channels_available,
+            self._channels_by_number,
+            self._channel_logos,
+        ) = await self._hass.async_add_executor_job(
+            _process_available_channels,
+            channel_cache.get("channels", []),
+            channel_mappings,
+            self._config.options.get(CONF_CHANNEL_REGION, DEF_CHANNEL_REGION),
+        )
+        self._channel_titles = {}
+        if debug_enabled:
+            _LOGGER.debug(self._log_formatter.format("finished processing channels"))
+
+    async def _async_cache_refresh_all(
+        self, _: Optional[dt_util.dt.datetime] = None
+    ) -> None:
+        """Fetch the channels and, if needed, the channel mappings together.
+
+        The fetches are independent of each other so they run concurrently and
+        the available channels are processed once both have finished.
+
+        :return: None
+        """
+        debug_enabled: bool = _LOGGER.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            _LOGGER.debug(self._log_formatter.format("entered"))
+
+        fetches: List[Awaitable[None]] = [self._async_cache_channels()]
+        if (
+            self._config.options.get(CONF_DEVICE_PLATFORM, DEF_DEVICE_PLATFORM).lower()
+            == "v6"
+        ):
+            fetches.append(self._cache_details.get("channel_mappings").async_fetch())
+        await asyncio.gather(*fetches)
+        await self._async_cache_process_available_channels(
+            channel_cache=self._cache_details.get("channels").contents
+        )
+
+        if debug_enabled:
+            _LOGGER.debug(self._log_formatter.format("exited"))
 
     async def _async_fetch_player_state(
         self, _: Optional[dt_util.dt.datetime] = None
@@ -589,17 +795,12 @@ class VirginMediaPlayer(MediaPlayerEntity, ABC):
         :param _: Unused parameter denoting time the method was called
         :return: None
         """
-        skip_update_flags = [_FLAG_TURNING_OFF]
-        if any(
-            [
-                flag_value
-                for flag_name, flag_value in self._flags.items()
-                if flag_name in skip_update_flags
-            ]
-        ):
-            _LOGGER.debug(
-                self._log_formatter.format("skipping due to current processing")
-            )
+        debug_enabled: bool = _LOGGER.isEnabledFor(logging.DEBUG)
+        if self._turning_off:
+            if debug_enabled:
+                _LOGGER.debug(
+                    self._log_formatter.format("skipping due to current processing")
+                )
             return
 
         async with self._lock_client:
@@ -618,12 +819,16 @@ class VirginMediaPlayer(MediaPlayerEntity, ABC):
                                 type(err),
                                 err,
                             )
-                            _LOGGER.debug(
-                                self._log_formatter.format("device.channel_number: %s"),
-                                self._client.device.channel_number,
-                            )
+                            if debug_enabled:
+                                _LOGGER.debug(
+                                    self._log_formatter.format(
+                                        "device.channel_number: %s"
+                                    ),
+                                    self._client.device.channel_number,
+                                )
             except VirginMediaCommandTimeout:
-                _LOGGER.debug(self._log_formatter.format("unable to connect"))
+                if debug_enabled:
+                    _LOGGER.debug(self._log_formatter.format("unable to connect"))
                 return
             except VirginMediaError as err:
                 _LOGGER.warning(
@@ -635,160 +840,145 @@ class VirginMediaPlayer(MediaPlayerEntity, ABC):
                 )
                 return
 
-        if self._client.device.channel_number:
-            # region #-- entity should be on --#
-            # region #-- cancel listeners that may be running whilst off --#
-            if "idle_to_off" in self._listeners:
-                self._ils_cancel(name="idle_to_off", cancel_type="listener")
-            # endregion
-
-            if self._client.device.channel_number != self.media_channel:
-                _LOGGER.debug(
-                    self._log_formatter.format("channel changed from %s to %s"),
-                    self._channel_current["number"],
-                    self._client.device.channel_number,
-                )
-                self._channel_current["number"] = self._client.device.channel_number
-
-                if self._config.options.get(
-                    CONF_CHANNEL_FETCH_ENABLE, DEF_CHANNEL_FETCH_ENABLE
-                ):
-                    self._channel_current["details"] = self._channel_details(
-                        channel_number=self._channel_current["number"]
-                    )
-
-                    # region #-- get the station_id --#
-                    if self._channel_current["details"]:
-                        station_schedules = self._channel_current["details"].get(
-                            "stationSchedules"
-                        )
-                        if station_schedules:
-                            station_details = station_schedules[0]
-                            station_details = station_details.get("station", {})
-                            station_id = station_details.get("id")
-                            self._channel_current["station_id"] = station_id
-                    # endregion
-
-                    if not self._channel_current.get("station_id"):
-                        _LOGGER.warning(
-                            self._log_formatter.format(
-                                "unable to retrieve station id for %d"
-                            ),
-                            self._channel_current["number"],
-                        )
-                    else:
-                        # region #-- load the listings cache --#
+        # program/position changes are written once when the fetch is done
+        self._defer_state_write = True
+        try:
+            if self._client.device.channel_number:
+                # region #-- entity should be on --#
+                # region #-- cancel listeners that may be running whilst off --#
+                if "idle_to_off" in self._listeners:
+                    self._ils_cancel(name="idle_to_off", cancel_type="listener")
+                # endregion
+
+                if self._client.device.channel_number != self.media_channel:
+                    if debug_enabled:
                         _LOGGER.debug(
-                            self._log_formatter.format("station id for %d: %s"),
+                            self._log_formatter.format("channel changed from %s to %s"),
                             self._channel_current["number"],
-                            self._channel_current["station_id"],
+                            self._client.device.channel_number,
                         )
-                        self._cache_details["listings"] = VirginMediaCacheListings(
-                            age=self._config.options.get(
-                                CONF_CHANNEL_LISTINGS_CACHE, DEF_CHANNEL_LISTINGS_CACHE
-                            ),
-                            hass=self._hass,
-                            station_id=self._channel_current["station_id"],
-                            unique_id=self._config.unique_id,
+                    self._channel_current["number"] = self._client.device.channel_number
+
+                    if self._config.options.get(
+                        CONF_CHANNEL_FETCH_ENABLE, DEF_CHANNEL_FETCH_ENABLE
+                    ):
+                        self._channel_current["details"] = self._channel_details(
+                            channel_number=self._channel_current["number"]
                         )
-                        if self._cache_details["listings"].is_stale:
-                            await self._async_cache_listings()
-                        # endregion
 
-                        # region #-- set the listings to cache again --#
-                        if "listings_update" in self._listeners:
-                            self._ils_cancel(
-                                cancel_type="listener", name="listings_update"
-                            )
-                        if self._cache_details.get("listings").contents:
-                            self._ils_create(
-                                create_type="listener",
-                                name="listings_update",
-                                func=self._async_cache_listings,
-                                when=dt_util.dt.datetime.fromtimestamp(
-                                    self._cache_details.get("listings").expires_at
-                                ),
+                        # region #-- get the station_id --#
+                        if self._channel_current["details"]:
+                            station_schedules = self._channel_current["details"].get(
+                                "stationSchedules"
                             )
+                            if station_schedules:
+                                station_details = station_schedules[0]
+                                station_details = station_details.get("station", {})
+                                station_id = station_details.get("id")
+                                self._channel_current["station_id"] = station_id
                         # endregion
 
-                        # region #-- set the current program details --#
-                        self._current_program_set()
-                        # endregion
-
-                self._state = STATE_PLAYING
-            # endregion
-        else:
-            # region #-- entity should be off --#
-            # region #-- cancel listeners that may be running whilst on --#
-            if "current_program" in self._listeners:
-                self._ils_cancel(cancel_type="listener", name="current_program")
-            if "listings_update" in self._listeners:
-                self._ils_cancel(cancel_type="listener", name="listings_update")
-            if "media_position" in self._intervals:
-                self._ils_cancel(cancel_type="interval", name="media_position")
-            # endregion
-
-            # region #-- set the extra attributes --#
-            if self._channel_current["number"]:
-                self._extra_state_attributes[
-                    "channel_at_idle_off"
-                ] = self._channel_current["number"]
-            # endregion
-
-            # region #-- set the state --#
-            if not self._config.options.get(CONF_IDLE_TIMEOUT):
-                self._state = STATE_OFF
-            else:
-                if self._state != STATE_OFF:
-                    self._state = STATE_IDLE
-                    # region #-- set up a listener to fire if we need to turn off after a period of time --#
-                    if self._config.options.get(CONF_IDLE_TIMEOUT, DEF_IDLE_TIMEOUT):
-
-                        def _idle_to_off(_: Optional[dt_util.dt.datetime] = None):
-                            """Switch the player to off if idle after a period of time."""
-                            _LOGGER.debug(self._log_formatter.format("entered"))
-                            _LOGGER.debug(
-                                self._log_formatter.format("current state: %s"),
-                                self._state,
+                        if not self._channel_current.get("station_id"):
+                            _LOGGER.warning(
+                                self._log_formatter.format(
+                                    "unable to retrieve station id for %d"
+                                ),
+                                self._channel_current["number"],
                             )
-                            if self._state == STATE_IDLE:
+                        else:
+                            # region #-- load the listings cache --#
+                            if debug_enabled:
                                 _LOGGER.debug(
-                                    self._log_formatter.format("setting state to off")
+                                    self._log_formatter.format("station id for %d: %s"),
+                                    self._channel_current["number"],
+                                    self._channel_current["station_id"],
                                 )
-                                self._state = STATE_OFF
-                                self.async_schedule_update_ha_state()
-                            if "idle_to_off" in self._listeners:
+                            self._cache_details["listings"] = self._listings_cache(
+                                station_id=self._channel_current["station_id"]
+                            )
+                            if await self._cache_details["listings"].async_is_stale():
+                                await self._async_cache_listings()
+                            # endregion
+
+                            # region #-- set the listings to cache again --#
+                            if "listings_update" in self._listeners:
                                 self._ils_cancel(
-                                    cancel_type="listener", name="idle_to_off"
+                                    cancel_type="listener", name="listings_update"
                                 )
-                            _LOGGER.debug(self._log_formatter.format("exited"))
+                            if self._cache_details.get("listings").contents:
+                                self._ils_create(
+                                    create_type="listener",
+                                    name="listings_update",
+                                    func=self._async_cache_listings,
+                                    when=dt_util.dt.datetime.fromtimestamp(
+                                        self._cache_details.get("listings").expires_at
+                                    ),
+                                )
+                            # endregion
 
-                        if "idle_to_off" not in self._listeners:
-                            num_hours = self._config.options.get(
-                                CONF_IDLE_TIMEOUT, DEF_IDLE_TIMEOUT
-                            )
-                            fire_at = dt_util.now() + dt_util.dt.timedelta(
-                                hours=num_hours
-                            )
-                            _LOGGER.debug(
-                                self._log_formatter.format(
-                                    "switching from idle to off at: %s"
-                                ),
-                                fire_at,
-                            )
-                            self._ils_create(
-                                create_type="listener",
-                                name="idle_to_off",
-                                func=_idle_to_off,
-                                when=fire_at,
-                            )
-                    # endregion
-            # endregion
+                            # region #-- set the current program details --#
+                            self._current_program_set()
+                            # endregion
 
-            self._channel_current["number"] = None
-            # endregion
+                    self._state = STATE_PLAYING
+                # endregion
+            else:
+                # region #-- entity should be off --#
+                # region #-- cancel listeners that may be running whilst on --#
+                if "current_program" in self._listeners:
+                    self._ils_cancel(cancel_type="listener", name="current_program")
+                if "listings_update" in self._listeners:
+                    self._ils_cancel(cancel_type="listener", name="listings_update")
+                if "media_position" in self._intervals:
+                    self._ils_cancel(cancel_type="interval", name="media_position")
+                # endregion
+
+                # region #-- set the extra attributes --#
+                if self._channel_current["number"]:
+                    self._extra_state_attributes[
+                        "channel_at_idle_off"
+                    ] = self._channel_current["number"]
+                # endregion
+
+                # region #-- set the state --#
+                if not self._config.options.get(CONF_IDLE_TIMEOUT):
+                    self._state = STATE_OFF
+                else:
+                    if self._state != STATE_OFF:
+                        self._state = STATE_IDLE
+                        # region #-- set up a listener to fire if we need to turn off after a period of time --#
+                        if self._config.options.get(
+                            CONF_IDLE_TIMEOUT, DEF_IDLE_TIMEOUT
+                        ):
+                            if "idle_to_off" not in self._listeners:
+                                num_hours = self._config.options.get(
+                                    CONF_IDLE_TIMEOUT, DEF_IDLE_TIMEOUT
+                                )
+                                fire_at = dt_util.now() + dt_util.dt.timedelta(
+                                    hours=num_hours
+                                )
+                                if debug_enabled:
+                                    _LOGGER.debug(
+                                        self._log_formatter.format(
+                                            "switching from idle to off at: %s"
+                                        ),
+                                        fire_at,
+                                    )
+                                self._ils_create(
+                                    create_type="listener",
+                                    name="idle_to_off",
+                                    func=self._idle_to_off,
+                                    when=fire_at,
+                                )
+                        # endregion
+                # endregion
+
+                self._channel_current["number"] = None
+                # endregion
+        finally:
+            self._defer_state_write = False
 
-        self.async_schedule_update_ha_state()
+        self.async_write_ha_state()
 
     async def _async_send_ircode(
         self, code: str, from_service: bool = False, **_
@@ -825,9 +1015,10 @@ class VirginMediaPlayer(MediaPlayerEntity, ABC):
                             type(err),
                             err,
                         )
-                        if not isinstance(
-                            err, VirginMediaCommandTimeout
-                        ) and not self._flags.get(_FLAG_TURNING_ON):
+                        if (
+                            not isinstance(err, VirginMediaCommandTimeout)
+                            and not self._turning_on
+                        ):
                             raise err from None
         _LOGGER.debug(self._log_formatter.format("exited"))
 
@@ -879,12 +1070,7 @@ class VirginMediaPlayer(MediaPlayerEntity, ABC):
         :return: None
         """
         # region #-- force channel sync --#
-        await self._async_cache_channels()
-        if (
-            self._config.options.get(CONF_DEVICE_PLATFORM, DEF_DEVICE_PLATFORM).lower()
-            == "v6"
-        ):
-            await self._async_cache_channel_mappings()
+        await self._async_cache_refresh_all()
         # endregion
 
         # region #-- update the details in this instance --#
@@ -904,113 +1090,187 @@ class VirginMediaPlayer(MediaPlayerEntity, ABC):
         :return: None
         """
         _LOGGER.debug(self._log_formatter.format("entered"))
+        self._removing = False
 
         # region #-- setup the channel numbers and listings if needed --#
         if self._config.options.get(
             CONF_CHANNEL_FETCH_ENABLE, DEF_CHANNEL_FETCH_ENABLE
         ):
+            use_channel_mappings: bool = (
+                self._config.options.get(
+                    CONF_DEVICE_PLATFORM, DEF_DEVICE_PLATFORM
+                ).lower()
+                == "v6"
+            )
+
             # region #-- setup the channels cache --#
-            async def _async_cache_channels_start(
-                _: Optional[dt_util.dt.datetime] = None,
-            ) -> None:
-                """Cache the channels and set a timer up.
+            def _cache_channels_schedule() -> None:
+                """Set up the timer to cache the channels again.
 
                 :return: None
                 """
-                _LOGGER.debug(self._log_formatter.format("entered"))
-                await self._async_cache_channels()
                 self._ils_create(
-                    create_type="interval",
+                    create_type="listener",
                     name="channel_cache",
-                    func=self._async_cache_channels,
-                    when=dt_util.dt.timedelta(
-                        hours=self._config.options.get(
+                    func=_async_cache_channels_start,
+                    when=dt_util.now()
+                    + _jittered_interval(
+                        self._config.options.get(
                             CONF_CHANNEL_INTERVAL, DEF_CHANNEL_INTERVAL
                         )
                     ),
                 )
                 self._ils_cancel(name="channels_init_cache", cancel_type="listener")
+
+            async def _async_cache_channels_start(
+                _: Optional[dt_util.dt.datetime] = None,
+            ) -> None:
+                """Cache the channels and set a timer up.
+
+                :return: None
+                """
+                _LOGGER.debug(self._log_formatter.format("entered"))
+                await self._async_cache_channels()
+                _cache_channels_schedule()
                 _LOGGER.debug(self._log_formatter.format("exited"))
 
-            if not self._cache_details.get(
-                "channels"
-            ).is_stale:  # property forces a load from cache
-                cache_again_at = dt_util.dt.datetime.fromtimestamp(
-                    self._cache_details.get("channels").expires_at
-                )
+            # endregion
+
+            # region #-- setup the channel mappings cache --#
+            def _cache_channel_mappings_schedule() -> None:
+                """Set up the timer to cache the channel mappings again.
+
+                :return: None
+                """
                 self._ils_create(
                     create_type="listener",
-                    name="channels_init_cache",
-                    func=_async_cache_channels_start,
-                    when=cache_again_at,
+                    name="channel_mappings_cache",
+                    func=_async_cache_channel_mappings_start,
+                    when=dt_util.now()
+                    + _jittered_interval(
+                        self._config.options.get(
+                            CONF_CHANNEL_INTERVAL, DEF_CHANNEL_INTERVAL
+                        )
+                    ),
                 )
-                _LOGGER.debug(
-                    self._log_formatter.format("channels will re-cache at: %s"),
-                    cache_again_at,
+                self._ils_cancel(
+                    name="channel_mappings_init_cache", cancel_type="listener"
                 )
-            else:
-                await _async_cache_channels_start()
-            _LOGGER.debug(self._log_formatter.format("channels loaded"))
+
+            async def _async_cache_channel_mappings_start(
+                _: Optional[dt_util.dt.datetime] = None,
+            ) -> None:
+                """Cache the channel mappings and set a timer up.
+
+                :return: None
+                """
+                _LOGGER.debug(self._log_formatter.format("entered"))
+                await self._async_cache_channel_mappings()
+                _cache_channel_mappings_schedule()
+                _LOGGER.debug(self._log_formatter.format("exited"))
+
             # endregion
 
-            # region #-- set up the channel mappings cache --#
-            if (
-                self._config.options.get(
-                    CONF_DEVICE_PLATFORM, DEF_DEVICE_PLATFORM
-                ).lower()
-                == "v6"
-            ):
+            # region #-- setup fetching everything together --#
+            async def _async_cache_refresh_all_start() -> None:
+                """Cache the channels and channel mappings and set the timers up.
 
-                async def _async_cache_channel_mappings_start(
-                    _: Optional[dt_util.dt.datetime] = None,
-                ) -> None:
-                    """Cache the channel mappings and set a timer up.
+                :return: None
+                """
+                _LOGGER.debug(self._log_formatter.format("entered"))
+                await self._async_cache_refresh_all()
+                _cache_channels_schedule()
+                _cache_channel_mappings_schedule()
+                _LOGGER.debug(self._log_formatter.format("exited"))
 
-                    :return: None
-                    """
-                    _LOGGER.debug(self._log_formatter.format("entered"))
-                    await self._async_cache_channel_mappings()
-                    self._ils_create(
-                        create_type="interval",
-                        name="channel_mappings_cache",
-                        func=self._async_cache_channel_mappings,
-                        when=dt_util.dt.timedelta(
-                            hours=self._config.options.get(
-                                CONF_CHANNEL_INTERVAL, DEF_CHANNEL_INTERVAL
-                            )
-                        ),
-                    )
-                    self._ils_cancel(
-                        name="channel_mappings_init_cache", cancel_type="listener"
-                    )
-                    _LOGGER.debug(self._log_formatter.format("exited"))
+            # endregion
 
-                if not self._cache_details.get(
-                    "channel_mappings"
-                ).is_stale:  # property forces a load from cache
-                    self._cache_process_available_channels(
-                        channel_cache=self._cache_details.get("channels").contents
-                    )
+            # Anything that is cached gets used straight away, even if it's due
+            # a refresh. Only a missing cache holds up the setup of the entity,
+            # otherwise the refresh happens in the background.
+            channels_cache: VirginMediaCache = self._cache_details.get("channels")
+            channel_mappings_cache: VirginMediaCache = self._cache_details.get(
+                "channel_mappings"
+            )
+            await channels_cache.async_is_stale()  # forces a load from cache
+            channels_refresh: bool = (
+                channels_cache.is_missing or channels_cache.is_refresh_due
+            )
+            channel_mappings_refresh: bool = False
+            if use_channel_mappings:
+                await channel_mappings_cache.async_is_stale()  # forces a load from cache
+                channel_mappings_refresh = (
+                    channel_mappings_cache.is_missing
+                    or channel_mappings_cache.is_refresh_due
+                )
 
+            if channels_refresh and channel_mappings_refresh:
+                # region #-- fetch everything together --#
+                if channels_cache.is_missing or channel_mappings_cache.is_missing:
+                    await _async_cache_refresh_all_start()
+                else:
+                    await self._async_cache_process_available_channels(
+                        channel_cache=channels_cache.contents
+                    )
+                    self._create_background_task(_async_cache_refresh_all_start())
+                _LOGGER.debug(
+                    self._log_formatter.format("channels and channel mappings loaded")
+                )
+                # endregion
+            else:
+                # region #-- load the channels --#
+                if not channels_refresh:
                     cache_again_at = dt_util.dt.datetime.fromtimestamp(
-                        self._cache_details.get("channel_mappings").expires_at
+                        channels_cache.refresh_at
                     )
                     self._ils_create(
                         create_type="listener",
                         name="channels_init_cache",
-                        func=_async_cache_channel_mappings_start,
+                        func=_async_cache_channels_start,
                         when=cache_again_at,
                     )
                     _LOGGER.debug(
-                        self._log_formatter.format(
-                            "channel mappings will re-cache at: %s"
-                        ),
+                        self._log_formatter.format("channels will re-cache at: %s"),
                         cache_again_at,
                     )
+                elif channels_cache.is_missing:
+                    await _async_cache_channels_start()
                 else:
-                    await _async_cache_channel_mappings_start()
-                _LOGGER.debug(self._log_formatter.format("channel mappings loaded"))
-            # endregion
+                    self._create_background_task(_async_cache_channels_start())
+                _LOGGER.debug(self._log_formatter.format("channels loaded"))
+                # endregion
+
+                # region #-- load the channel mappings --#
+                if use_channel_mappings:
+                    if not channel_mappings_cache.is_missing:
+                        await self._async_cache_process_available_channels(
+                            channel_cache=channels_cache.contents
+                        )
+
+                    if not channel_mappings_refresh:
+                        cache_again_at = dt_util.dt.datetime.fromtimestamp(
+                            channel_mappings_cache.refresh_at
+                        )
+                        self._ils_create(
+                            create_type="listener",
+                            name="channel_mappings_init_cache",
+                            func=_async_cache_channel_mappings_start,
+                            when=cache_again_at,
+                        )
+                        _LOGGER.debug(
+                            self._log_formatter.format(
+                                "channel mappings will re-cache at: %s"
+                            ),
+                            cache_again_at,
+                        )
+                    elif channel_mappings_cache.is_missing:
+                        await _async_cache_channel_mappings_start()
+                    else:
+                        self._create_background_task(
+                            _async_cache_channel_mappings_start()
+                        )
+                    _LOGGER.debug(self._log_formatter.format("channel mappings loaded"))
+                # endregion
         # endregion
 
         # region #-- update now --#
@@ -1038,38 +1298,49 @@ class VirginMediaPlayer(MediaPlayerEntity, ABC):
         """
         _LOGGER.debug(self._log_formatter.format("entered"))
 
-        async with self._lock_removing:
-            # region #-- stop the timers --#
-            _LOGGER.debug(
-                self._log_formatter.format("%d intervals to stop"),
-                len(self._intervals),
-            )
-            interval_names = list(self._intervals.keys())
-            for interval_name in interval_names:
-                self._ils_cancel(name=interval_name, cancel_type="interval")
-            # endregion
+        # stop anything new being scheduled whilst (or after) cleaning up
+        self._removing = True
 
-            # region #-- cancel the listeners --#
-            _LOGGER.debug(
-                self._log_formatter.format("%d listeners to cancel"),
-                len(self._listeners),
-            )
-            listener_names = list(self._listeners.keys())
-            for listener_name in listener_names:
-                self._ils_cancel(name=listener_name, cancel_type="interval")
-            # endregion
+        # region #-- cancel the background tasks --#
+        _LOGGER.debug(
+            self._log_formatter.format("%d background tasks to cancel"),
+            len(self._background_tasks),
+        )
+        for task in list(self._background_tasks):
+            task.cancel()
+        # endregion
 
-            # region #-- stop the listening for the signals --#
-            _LOGGER.debug(
-                self._log_formatter.format("%d signals to stop listening for"),
-                len(self._signals),
-            )
-            signal_names = list(self._signals.keys())
-            for signal_name in signal_names:
-                self._ils_cancel(name=signal_name, cancel_type="signal")
-            # endregion
+        # region #-- stop the timers --#
+        _LOGGER.debug(
+            self._log_formatter.format("%d intervals to stop"),
+            len(self._intervals),
+        )
+        interval_names = list(self._intervals.keys())
+        for interval_name in interval_names:
+            self._ils_cancel(name=interval_name, cancel_type="interval")
+        # endregion
 
-            _LOGGER.debug(self._log_formatter.format("exited"))
+        # region #-- cancel the listeners --#
+        _LOGGER.debug(
+            self._log_formatter.format("%d listeners to cancel"),
+            len(self._listeners),
+        )
+        listener_names = list(self._listeners.keys())
+        for listener_name in listener_names:
+            self._ils_cancel(name=listener_name, cancel_type="listener")
+        # endregion
+
+        # region #-- stop the listening for the signals --#
+        _LOGGER.debug(
+            self._log_formatter.format("%d signals to stop listening for"),
+            len(self._signals),
+        )
+        signal_names = list(self._signals.keys())
+        for signal_name in signal_names:
+            self._ils_cancel(name=signal_name, cancel_type="signal")
+        # endregion
+
+        _LOGGER.debug(self._log_formatter.format("exited"))
 
     # endregion
 
@@ -1113,7 +1384,7 @@ class VirginMediaPlayer(MediaPlayerEntity, ABC):
             self._state = STATE_PAUSED
         elif self._state == STATE_PAUSED:
             self._state = STATE_PLAYING
-        self.async_schedule_update_ha_state()
+        self.async_write_ha_state()
         _LOGGER.debug(self._log_formatter.format("exited"))
 
     async def async_media_play(self) -> None:
@@ -1122,7 +1393,7 @@ class VirginMediaPlayer(MediaPlayerEntity, ABC):
         await self._async_send_keycode(code="play")
         if self._state not in (STATE_OFF, STATE_IDLE):
             self._state = STATE_PLAYING
-        self.async_schedule_update_ha_state()
+        self.async_write_ha_state()
         _LOGGER.debug(self._log_formatter.format("exited"))
 
     async def async_media_stop(self) -> None:
@@ -1131,7 +1402,7 @@ class VirginMediaPlayer(MediaPlayerEntity, ABC):
         await self._async_send_keycode(code="stop")
         if self._state == STATE_PAUSED:
             self._state = STATE_PLAYING
-        self.async_schedule_update_ha_state()
+        self.async_write_ha_state()
         _LOGGER.debug(self._log_formatter.format("exited"))
 
     async def async_play_media(self, media_type, media_id, **kwargs) -> None:
@@ -1190,25 +1461,25 @@ class VirginMediaPlayer(MediaPlayerEntity, ABC):
     async def async_turn_off(self) -> None:
         """Turn the media player off."""
         _LOGGER.debug(self._log_formatter.format("entered"))
-        self._flags[_FLAG_TURNING_OFF] = True
+        self._turning_off = True
         if self._state not in (STATE_OFF, STATE_IDLE):
             _LOGGER.debug(self._log_formatter.format("issuing turn off request"))
             await self._async_send_ircode(code="standby")
             await self._async_send_ircode(code="standby")
             self._state = STATE_OFF
-            self.async_schedule_update_ha_state()
+            self.async_write_ha_state()
         else:
             _LOGGER.warning(
                 self._log_formatter.format("invalid state for turning off: %s"),
                 self._state,
             )
-        self._flags[_FLAG_TURNING_OFF] = False
+        self._turning_off = False
         _LOGGER.debug(self._log_formatter.format("exited"))
 
     async def async_turn_on(self) -> None:
         """Turn the media player on."""
         _LOGGER.debug(self._log_formatter.format("entered"))
-        self._flags[_FLAG_TURNING_ON] = True
+        self._turning_on = True
         if self._state in (STATE_IDLE, STATE_OFF):
             await self._async_send_ircode(code="standby")
             if not self._client.device.channel_number:
@@ -1221,13 +1492,13 @@ class VirginMediaPlayer(MediaPlayerEntity, ABC):
                 await self._async_fetch_player_state()
                 await asyncio.sleep(0.2)
             self._state = STATE_PLAYING
-            self.async_schedule_update_ha_state()
+            self.async_write_ha_state()
         else:
             _LOGGER.warning(
                 self._log_formatter.format("invalid state for turning on: %s"),
                 self._state,
             )
-        self._flags[_FLAG_TURNING_ON] = False
+        self._turning_on = False
         _LOGGER.debug(self._log_formatter.format("exited"))
 
     # endregion
@@ -1,7 +1,7 @@
 """Logging."""
 
 # region #-- imports --#
-import inspect
+import sys
 
 # endregion
 
@@ -16,7 +16,9 @@ class Logger:
 
     def format(self, message: str, include_lineno: bool = False) -> str:
         """Format a log message in the correct format."""
-        caller: inspect.FrameInfo = inspect.stack()[1]
-        line_no = f" --> line: {caller.lineno}" if include_lineno else ""
+        caller = sys._getframe(1)  # pylint: disable=protected-access
+        line_no = f" --> line: {caller.f_lineno}" if include_lineno else ""
         unique_id = f" ({self._unique_id})" if self._unique_id else ""
-        return f"{self._prefix}{caller.function}{unique_id}{line_no} --> {message}"
+        return (
+            f"{self._prefix}{caller.f_code.co_name}{unique_id}{line_no} --> {message}"
+        )
@@ -33,8 +33,18 @@ _LOGGER = logging.getLogger(__name__)
 class API:
     """Virgin Media TV Guide API."""
 
-    def __init__(self, username: str, password: str, existing_session=None) -> None:
-        """Initialise."""
+    def __init__(
+        self,
+        username: str,
+        password: str,
+        existing_session=None,
+        session: Optional[aiohttp.ClientSession] = None,
+    ) -> None:
+        """Initialise.
+
+        A client session provided by the caller is reused (e.g. across login retries)
+        and is left open when the API is closed.
+        """
         if existing_session is None:
             existing_session = {}
 
@@ -48,7 +58,8 @@ class API:
         self._log_formatter: Logger = Logger()
         self._login_redirect: str = ""
         self._password: str = password
-        self._session: Optional[aiohttp.ClientSession] = None
+        self._session: Optional[aiohttp.ClientSession] = session
+        self._session_external: bool = session is not None
         self._username: str = username
 
     async def __aenter__(self) -> "API":
@@ -64,13 +75,18 @@ class API:
     def _create_session(self) -> None:
         """Initialise the client session."""
         _LOGGER.debug(self._log_formatter.format("entered"))
-        self._session = aiohttp.ClientSession(raise_for_status=True)
+        if self._session_external:
+            # keep the connections but don't carry cookies over from a previous login
+            self._session.cookie_jar.clear()
+        else:
+            self._session = aiohttp.ClientSession(raise_for_status=True)
         _LOGGER.debug(self._log_formatter.format("exited"))
 
     async def _async_close_session(self) -> None:
         """Close the client session."""
         _LOGGER.debug(self._log_formatter.format("entered"))
-        await self._session.close()
+        if not self._session_external:
+            await self._session.close()
         _LOGGER.debug(self._log_formatter.format("exited"))
 
     async def _async_get_request(self, url: str, **kwargs) -> aiohttp.ClientResponse:
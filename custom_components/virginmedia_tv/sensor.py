@@ -6,7 +6,7 @@ import logging
 from homeassistant.components.sensor import DOMAIN as ENTITY_DOMAIN
 from homeassistant.components.sensor import SensorEntity, StateType
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import DeviceInfo, EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
@@ -50,17 +50,18 @@ class TiVoSoftwareSensor(SensorEntity):
         self._state: str = self._config.data.get(CONF_SWVERSION, "")
 
     # region #-- private methods --#
+    @callback
     def _update_callback(self, swversion: str) -> None:
         """Update method for the sensor."""
-        _LOGGER.debug(self._log_formatter.format("entered, swversion: %s"), swversion)
+        _LOGGER.debug(self._log_formatter.lazy("entered, swversion: %s"), swversion)
         _LOGGER.debug(
-            self._log_formatter.format("sensor is: %s"),
+            self._log_formatter.lazy("sensor is: %s"),
             "enabled" if self.enabled else "disabled",
         )
         if self.enabled:
             self._state = swversion
-            self.async_schedule_update_ha_state()
-        _LOGGER.debug(self._log_formatter.format("exited"))
+            self.async_write_ha_state()
+        _LOGGER.debug(self._log_formatter.lazy("exited"))
 
     # endregion
 
@@ -70,7 +71,7 @@ class TiVoSoftwareSensor(SensorEntity):
 
         :return: None
         """
-        _LOGGER.debug(self._log_formatter.format("entered"))
+        _LOGGER.debug(self._log_formatter.lazy("entered"))
         self.async_on_remove(
             async_dispatcher_connect(
                 hass=self.hass,
@@ -78,7 +79,7 @@ class TiVoSoftwareSensor(SensorEntity):
                 target=self._update_callback,
             )
         )
-        _LOGGER.debug(self._log_formatter.format("exited"))
+        _LOGGER.debug(self._log_formatter.lazy("exited"))
 
     # endregion
 
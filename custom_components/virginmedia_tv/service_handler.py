@@ -12,7 +12,7 @@ from .caching import (
     VirginMediaCacheChannels,
     VirginMediaCacheListings,
 )
-from .const import DOMAIN
+from .const import CONF_AUTH_CACHE, DOMAIN
 from .logger import Logger
 
 # endregion
@@ -47,7 +47,7 @@ class VirginMediaServiceHandler:
         :param call: the service call that should be made
         :return: None
         """
-        _LOGGER.debug(self._log_formatter.format("entered, call: %s"), call)
+        _LOGGER.debug(self._log_formatter.lazy("entered, call: %s"), call)
 
         args = call.data.copy()
         method = getattr(self, call.service, None)
@@ -55,9 +55,9 @@ class VirginMediaServiceHandler:
             try:
                 await method(**args)
             except Exception as err:  # pylint: disable=broad-except
-                _LOGGER.warning(self._log_formatter.format("%s"), err)
+                _LOGGER.warning(self._log_formatter.lazy("%s"), err)
 
-        _LOGGER.debug(self._log_formatter.format("exited"))
+        _LOGGER.debug(self._log_formatter.lazy("exited"))
 
     def register_services(self) -> None:
         """Register the services."""
@@ -76,16 +76,26 @@ class VirginMediaServiceHandler:
 
     async def clear_cache(self, **kwargs) -> None:
         """Clear the given cache."""
-        _LOGGER.debug(self._log_formatter.format("entered, kwargs: %s"), kwargs)
+        _LOGGER.debug(self._log_formatter.lazy("entered, kwargs: %s"), kwargs)
 
         if kwargs.get("cache_type") == "auth":
-            VirginMediaCacheAuth(hass=self._hass, unique_id="").clear()
+            auth_caches = [
+                entry_data[CONF_AUTH_CACHE]
+                for entry_data in self._hass.data.get(DOMAIN, {}).values()
+                if CONF_AUTH_CACHE in entry_data
+            ] or [VirginMediaCacheAuth(hass=self._hass, unique_id="")]
+            for auth_cache in auth_caches:
+                await auth_cache.async_clear()
+            # the pooled API objects hold the old session so they must go too
+            await VirginMediaCacheAuth.async_close_apis()
         elif kwargs.get("cache_type") == "channels":
-            VirginMediaCacheChannels(hass=self._hass, unique_id="").clear()
-            VirginMediaCacheChannelMappings(hass=self._hass, unique_id="").clear()
+            await VirginMediaCacheChannels(hass=self._hass, unique_id="").async_clear()
+            await VirginMediaCacheChannelMappings(
+                hass=self._hass, unique_id=""
+            ).async_clear()
         elif kwargs.get("cache_type") == "listings":
-            VirginMediaCacheListings(
+            await VirginMediaCacheListings(
                 hass=self._hass, station_id="lgi-*", unique_id=""
-            ).clear()
+            ).async_clear()
 
-        _LOGGER.debug(self._log_formatter.format("exited"))
+        _LOGGER.debug(self._log_formatter.lazy("exited"))
@@ -0,0 +1 @@
+"""Tests for the Virgin Media TV integration."""
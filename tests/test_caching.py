@@ -0,0 +1,73 @@
+"""Tests for the caching module."""
+
+# region #-- imports --#
+import asyncio
+import importlib.util
+import os
+import tempfile
+import unittest
+from unittest.mock import AsyncMock, MagicMock
+
+if importlib.util.find_spec("homeassistant") is not None:
+    from custom_components.virginmedia_tv.caching import (
+        VirginMediaCacheAuth,
+        VirginMediaCacheListings,
+        _PooledAPI,
+    )
+    from custom_components.virginmedia_tv.pyvmtvguide.exceptions import (
+        VirginMediaTVGuideUnauthorized,
+    )
+
+# endregion
+
+
+@unittest.skipIf(
+    importlib.util.find_spec("homeassistant") is None, "Home Assistant not installed"
+)
+class TestListingsFetch(unittest.IsolatedAsyncioTestCase):
+    """Fetching listings over a pooled API."""
+
+    async def asyncSetUp(self) -> None:
+        """Set up a Home Assistant stand-in rooted in a temporary directory."""
+        self._config_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self._config_dir.cleanup)
+
+        self.hass = MagicMock()
+        self.hass.config.path = lambda *parts: os.path.join(
+            self._config_dir.name, *parts
+        )
+        self.hass.async_create_task = asyncio.ensure_future
+
+    async def asyncTearDown(self) -> None:
+        """Leave the pool empty for the next test."""
+        # pylint: disable=protected-access
+        VirginMediaCacheAuth._api_lock = None
+        VirginMediaCacheAuth._apis.clear()
+
+    async def test_failed_listing_fetch_evicts_pooled_api(self) -> None:
+        """A listing request that fails stops the API being reused."""
+        api = MagicMock()
+        api.async_get_listing = AsyncMock(side_effect=VirginMediaTVGuideUnauthorized)
+        api.__aexit__ = AsyncMock()
+        # pylint: disable=protected-access
+        VirginMediaCacheAuth._apis["user"] = _PooledAPI(api=api, password="pwd")
+
+        cache = VirginMediaCacheListings(
+            hass=self.hass, station_id="lgi-station", unique_id="test", age=1
+        )
+        await cache.async_fetch(username="user", password="pwd")
+
+        self.assertNotIn("user", VirginMediaCacheAuth._apis)
+        api.__aexit__.assert_awaited_once()
+        self.assertIsNone(cache.contents)
+
+    async def test_failed_fetch_leaves_replacement_api(self) -> None:
+        """A failed fetch only evicts the API object it was using."""
+        # pylint: disable=protected-access
+        old = _PooledAPI(api=MagicMock(), password="pwd")
+        new = _PooledAPI(api=MagicMock(), password="pwd")
+        VirginMediaCacheAuth._apis["user"] = new
+
+        self.assertFalse(VirginMediaCacheAuth._api_evict("user", old))
+        self.assertIs(VirginMediaCacheAuth._apis["user"], new)
+        self.assertFalse(new.evicted)